@@ -0,0 +1,35 @@
+"""add chunk indexes
+
+Revision ID: 7c41d9b20a5e
+Revises: 5099050ce941
+Create Date: 2026-08-31 10:05:42.118734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c41d9b20a5e'
+down_revision: Union[str, None] = '5099050ce941'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The chunk table is filtered by document/workflow foreign keys and by
+    # source on every lookup, but had no secondary indexes, so those queries
+    # degraded into sequential scans as the table grew.
+    op.create_index('ix_chunk_document_grsar_id', 'chunk', ['document_grsar_id'])
+    op.create_index('ix_chunk_workflow_id', 'chunk', ['workflow_id'])
+    op.create_index('ix_chunk_source_type', 'chunk', ['source', 'chunk_type'])
+    op.create_index('ix_document_workflow_id', 'document', ['workflow_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_document_workflow_id', table_name='document')
+    op.drop_index('ix_chunk_source_type', table_name='chunk')
+    op.drop_index('ix_chunk_workflow_id', table_name='chunk')
+    op.drop_index('ix_chunk_document_grsar_id', table_name='chunk')
@@ -1,17 +1,74 @@
 import argparse
+import atexit
 import os
+import queue
+import threading
 import xml.etree.ElementTree as ET
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional; fall back to the stdlib parser
+    lxml_etree = None
+
+from src.pubtator_utils.aws_handler.aws_connect import AWSConnection
 from src.pubtator_utils.file_handler.base_handler import FileHandler
 from src.pubtator_utils.file_handler.file_handler_factory import FileHandlerFactory
-from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
+from src.pubtator_utils.config_handler.config_reader import (
+    YAMLConfigLoader,
+    expand_path_template,
+)
 from src.pubtator_utils.logs_handler.logger import SingletonLogger
 
 # Initialize the logger
 logger_instance = SingletonLogger()
 logger = logger_instance.get_logger()
 
+# Pre-compiled XPath expressions: find() re-parses the path string on every
+# call, which adds up over millions of annotations. Compiled lxml XPath runs
+# the whole lookup at C level; the stdlib fallback keeps the find() path.
+if lxml_etree is not None:
+    _TYPE_XPATH = lxml_etree.XPath("infon[@key='type']/text()")
+    _PASSAGE_XPATH = lxml_etree.XPath(".//passage")
+else:
+    _TYPE_XPATH = None
+    _PASSAGE_XPATH = None
+
+
+# Annotation-keep rules per normalizer, as lookup tables instead of an
+# if/elif chain evaluated per annotation. disease/chemical/cellline keep only
+# their own annotation type; tmvar and gnorm2 keep everything except the
+# types already covered by the dedicated normalizers.
+_EXCLUDED_TYPES = frozenset({"Chemical", "Disease", "CellLine"})
+_KEEP_EXACT = {"disease": "Disease", "chemical": "Chemical", "cellline": "CellLine"}
+_KEEP_COMPLEMENT = frozenset({"tmvar", "gnorm2"})
+
+
+def _annotation_type(annotation):
+    """Return the annotation's infon type text, or None if absent."""
+    if _TYPE_XPATH is not None:
+        types = _TYPE_XPATH(annotation)
+        return types[0] if types else None
+    infon = annotation.find("infon[@key='type']")
+    return infon.text if infon is not None else None
+
+
+def _find_passages(element):
+    """Return all passage elements under the given element."""
+    if _PASSAGE_XPATH is not None:
+        return _PASSAGE_XPATH(element)
+    return element.findall(".//passage")
+
+
+def _serialize_bioc(merged_document):
+    """Serialize a merged BioC element to UTF-8 bytes with an XML declaration."""
+    if lxml_etree is not None and isinstance(merged_document, lxml_etree._Element):
+        return lxml_etree.tostring(
+            merged_document, xml_declaration=True, encoding="UTF-8"
+        )
+    return ET.tostring(merged_document, encoding="utf-8", xml_declaration=True)
+
 
 class BioCFileMerger:
     def __init__(
@@ -30,89 +87,153 @@ class BioCFileMerger:
         :param paths_config: A dictionary where keys are normalizer types and values are directory paths.
         :param file_handler: A file handler object to do file operations.
         """
+        self.workflow_id = workflow_id
+        self.source = source
+        path_values = {"workflow_id": workflow_id, "source": source}
         self.input_dirs = {
-            "disease": paths_config["taggerone_disease_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source),
-            "chemical": paths_config["nlmchem_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source),
-            "cellline": paths_config["taggerone_cellLine_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source),
-            "tmvar": paths_config["tmvar_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source),
-            "gnorm2": paths_config["gnorm2_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source),
+            "disease": expand_path_template(
+                paths_config["taggerone_disease_path"], **path_values
+            ),
+            "chemical": expand_path_template(
+                paths_config["nlmchem_path"], **path_values
+            ),
+            "cellline": expand_path_template(
+                paths_config["taggerone_cellLine_path"], **path_values
+            ),
+            "tmvar": expand_path_template(paths_config["tmvar_path"], **path_values),
+            "gnorm2": expand_path_template(paths_config["gnorm2_path"], **path_values),
         }
-        self.output_dir = (
-            paths_config["annotations_merged_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
+        self.output_dir = expand_path_template(
+            paths_config["annotations_merged_path"], **path_values
         )
+        # Fixed normalizer processing order, captured once rather than
+        # re-derived from dict iteration per file.
+        self._ordered_normalizers = tuple(self.input_dirs)
         self.file_handler = file_handler
+        # Lazily-listed set of tmvar output files, used for the gnorm2
+        # fallback decision (one listing per run instead of a per-file
+        # existence round-trip).
+        self._tmvar_files = None
 
         self.write_to_s3 = write_to_s3
         # Build S3 paths only if enabled
         if self.write_to_s3:
-            self.s3_annotations_merged_dir = s3_paths_config[
-                "annotations_merged_path"
-            ].replace("{source}", source)
+            self.s3_annotations_merged_dir = expand_path_template(
+                s3_paths_config["annotations_merged_path"], source=source
+            )
             self.s3_file_handler = s3_file_handler
+            # S3 PUTs dominate per-file wall-clock, so uploads run on a
+            # background thread fed through a bounded queue; the next file's
+            # parse+merge overlaps the previous file's upload.
+            self._upload_queue = queue.Queue(maxsize=8)
+            # Failures recorded by the uploader thread; re-raised on the
+            # caller's thread by wait_for_uploads/_shutdown_uploader so an
+            # async upload error still fails the run.
+            self._upload_failures = []
+            self._upload_thread = threading.Thread(
+                target=self._upload_worker, daemon=True
+            )
+            self._upload_thread.start()
+            atexit.register(self._shutdown_uploader)
         else:
             self.s3_annotations_merged_dir = self.s3_file_handler = None
+            self._upload_queue = self._upload_thread = None
 
     def merge_files(self):
         """
         Merge files from all input directories and write the combined output to the output directory.
+
+        Each file's merge is independent (one PMCID per file), so the work is
+        fanned out across a process pool; every worker builds its own merger
+        (and therefore its own boto3 client) via the pool initializer.
         """
-        file_names = self.file_handler.list_files(self.input_dirs["disease"])
-        for file_name in file_names:
-            if not file_name.endswith(".xml"):
-                continue
-            logger.info(f"Processing file: {file_name}")
-            # documents = [
-            #     self._parse_bioc_file(
-            #         self.file_handler.get_file_path(
-            #             self.input_dirs[normalizer], file_name
-            #         )
-            #     )
-            #     for normalizer in self.input_dirs
-            # ]
-            ###if tmvar file is not found fall back to gnorm2 file
-            documents = []
-            input_dirs_considered = []
-            for normalizer in self.input_dirs:
-                if normalizer == "tmvar":
-                    tmvar_path = self.file_handler.get_file_path(
-                        self.input_dirs["tmvar"], file_name
-                    )
-                    if os.path.exists(tmvar_path):
-                        documents.append(self._parse_bioc_file(tmvar_path))
-                        input_dirs_considered.append(normalizer)
-                    else:
-                        # fallback to gnorm2
-                        gnorm2_path = self.file_handler.get_file_path(
-                            self.input_dirs["gnorm2"], file_name
-                        )
-                        documents.append(self._parse_bioc_file(gnorm2_path))
-                        input_dirs_considered.append("gnorm2")
-                        logger.info(
-                            f"tmvar file not found for {file_name} so falling back to gnorm2 output"
-                        )
-                elif normalizer == "gnorm2":  # no need for gnorm2
-                    continue
+        # Stream the listing: on S3 the paginator yields keys page by page,
+        # so merging starts after the first page instead of after the full
+        # enumeration of the prefix.
+        file_names = self.file_handler.iter_files(
+            self.input_dirs["disease"], suffix=".xml"
+        )
+        max_workers = os.cpu_count() or 1
+
+        if max_workers <= 1:
+            for file_name in file_names:
+                self.merge_single_file(file_name)
+            self.wait_for_uploads()
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.workflow_id, self.source, self.write_to_s3),
+        ) as executor:
+            futures = {
+                executor.submit(_merge_one_file, file_name): file_name
+                for file_name in file_names
+            }
+            for future in as_completed(futures):
+                file_name = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Merging failed for file {file_name}: {e}")
+                    raise
+
+    def merge_single_file(self, file_name):
+        """
+        Merge the normalizer outputs for a single file and write the result.
+
+        :param file_name: Name of the BioC XML file to merge.
+        """
+        logger.info(f"Processing file: {file_name}")
+        ###if tmvar file is not found fall back to gnorm2 file
+        # Collect (normalizer, path) pairs only; the documents themselves
+        # are parsed inside _merge_documents, which fans the parses out
+        # over a thread pool — so all of a file's normalizer DOMs can be
+        # in flight at once, bounded by the normalizer count.
+        doc_sources = []
+        for normalizer in self._ordered_normalizers:
+            if normalizer == "tmvar":
+                tmvar_path = self.file_handler.get_file_path(
+                    self.input_dirs["tmvar"], file_name
+                )
+                if file_name in self._tmvar_file_set():
+                    doc_sources.append((normalizer, tmvar_path))
                 else:
-                    path = self.file_handler.get_file_path(
-                        self.input_dirs[normalizer], file_name
+                    # fallback to gnorm2
+                    gnorm2_path = self.file_handler.get_file_path(
+                        self.input_dirs["gnorm2"], file_name
+                    )
+                    doc_sources.append(("gnorm2", gnorm2_path))
+                    logger.info(
+                        f"tmvar file not found for {file_name} so falling back to gnorm2 output"
                     )
-                    documents.append(self._parse_bioc_file(path))
-                    input_dirs_considered.append(normalizer)
-            merged_document = self._merge_documents(documents, input_dirs_considered)
-            self._write_merged_file(file_name, merged_document)
-            logger.info(f"Merged file written: {file_name}")
+            elif normalizer == "gnorm2":  # no need for gnorm2
+                continue
+            else:
+                path = self.file_handler.get_file_path(
+                    self.input_dirs[normalizer], file_name
+                )
+                doc_sources.append((normalizer, path))
+        merged_document = self._merge_documents(doc_sources)
+        self._write_merged_file(file_name, merged_document)
+        logger.info(f"Merged file written: {file_name}")
+
+    def _tmvar_file_set(self):
+        """
+        Return the set of file names in the tmvar output directory, listing it
+        once per merger. os.path.exists only worked for local storage; going
+        through the handler keeps the fallback decision correct on S3 and
+        replaces one existence round-trip per file with a single listing.
+        """
+        if self._tmvar_files is None:
+            try:
+                self._tmvar_files = set(
+                    self.file_handler.list_files(self.input_dirs["tmvar"])
+                )
+            except Exception as e:
+                logger.info(f"Could not list tmvar directory, treating as empty: {e}")
+                self._tmvar_files = set()
+        return self._tmvar_files
 
     def _parse_bioc_file(self, file_path):
         """
@@ -125,32 +246,52 @@ class BioCFileMerger:
         tree = self.file_handler.parse_xml_file(file_path)
         return tree.getroot()
 
-    def _merge_documents(self, documents, input_dirs_considered):
+    def _merge_documents(self, doc_sources):
         """
         Merge multiple BioC documents into one with sequential annotation IDs.
 
-        :param documents: List of BioC document XML elements.
+        The per-normalizer parses are independent reads (S3 downloads in the
+        common deployment), so they are submitted to a thread pool and the
+        results are consumed in doc_sources order; download latency for later
+        normalizers overlaps the merge of earlier ones. In-flight DOMs are
+        bounded by the normalizer count.
+
+        :param doc_sources: List of (normalizer_name, file_path) tuples.
         :return: Merged BioC document XML element.
         """
-        merged_root = ET.Element("collection")
-
-        # Step 1: Process first document
-        normalizer_name = input_dirs_considered[0]
+        # The merged root must be built with the same implementation that
+        # parsed the documents (lxml elements cannot be appended into a
+        # stdlib tree, and vice versa).
+        xml_impl = lxml_etree if lxml_etree is not None else ET
+        merged_root = xml_impl.Element("collection")
         annotation_id = 0
-        annotation_id = self._process_annotations(
-            documents[0], normalizer_name, annotation_id, True
-        )
-        merged_root.extend(
-            documents[0]
-        )  # Start with the structure of the first document
-
-        # Step 2: Merge remaining documents
-        for doc_idx, document in enumerate(documents[1:], start=1):
-            normalizer_name = input_dirs_considered[doc_idx]
-            logger.info(f"Merging document from normalizer {normalizer_name}...")
-            annotation_id = self._process_annotations(
-                document, normalizer_name, annotation_id, False, merged_root
-            )
+
+        with ThreadPoolExecutor(max_workers=len(doc_sources)) as executor:
+            parse_futures = [
+                (normalizer_name, executor.submit(self._parse_bioc_file, file_path))
+                for normalizer_name, file_path in doc_sources
+            ]
+
+            for doc_idx, (normalizer_name, future) in enumerate(parse_futures):
+                document = future.result()
+                if doc_idx == 0:
+                    # Step 1: Process first document
+                    annotation_id = self._process_annotations(
+                        document, normalizer_name, annotation_id, True
+                    )
+                    merged_root.extend(
+                        document
+                    )  # Start with the structure of the first document
+                else:
+                    # Step 2: Merge remaining documents
+                    logger.info(
+                        f"Merging document from normalizer {normalizer_name}..."
+                    )
+                    annotation_id = self._process_annotations(
+                        document, normalizer_name, annotation_id, False, merged_root
+                    )
+                # document goes out of scope here and its DOM is released
+                # once the merge of this normalizer finishes.
 
         logger.info("Merging completed.")
         return merged_root
@@ -167,64 +308,60 @@ class BioCFileMerger:
         :param is_first_doc: Boolean indicating if this is the first document
         :param merged_root: The merged document root (used for additional documents)
         """
-        for passage_idx, passage in enumerate(document.findall(".//passage")):
-            if not is_first_doc:
-                merged_passage = merged_root.find("document").findall("passage")[
-                    passage_idx
-                ]
-            else:
-                merged_passage = passage
+        # Resolve the keep rule for this normalizer once, outside the
+        # per-annotation loop.
+        keep_exact = _KEEP_EXACT.get(normalizer_name)
+        keep_complement = normalizer_name in _KEEP_COMPLEMENT
+
+        # Pair source and merged passages up front; re-running
+        # findall("passage") and indexing it per iteration is O(P^2) in the
+        # passage count.
+        passages = _find_passages(document)
+        if is_first_doc:
+            passage_pairs = zip(passages, passages)
+        else:
+            merged_passages = merged_root.find("document").findall("passage")
+            passage_pairs = zip(passages, merged_passages)
 
-            annotations_to_remove = []
+        for passage, merged_passage in passage_pairs:
+            kept = []
             for annotation in passage.findall("annotation"):
-                annotation_type = (
-                    annotation.find("infon[@key='type']").text
-                    if annotation.find("infon[@key='type']") is not None
-                    else None
-                )
+                annotation_type = _annotation_type(annotation)
 
-                if self._should_keep_annotation(normalizer_name, annotation_type):
-                    annotation.set("id", str(annotation_id))
-                    annotation_id += 1
-                    if not is_first_doc:
-                        merged_passage.append(annotation)
+                if keep_exact is not None:
+                    keep = annotation_type == keep_exact
                 else:
-                    annotations_to_remove.append(annotation)
+                    keep = (
+                        keep_complement and annotation_type not in _EXCLUDED_TYPES
+                    )
 
-            # Remove unwanted annotations from the first document
-            if is_first_doc:
-                for annotation in annotations_to_remove:
-                    passage.remove(annotation)
+                if keep:
+                    kept.append(annotation)
 
-        return annotation_id  # Ensure annotation_id is carried over correctly
+            # Renumber the kept annotations in one batch: map(str, range(...))
+            # stringifies the whole id block at C level instead of one str()
+            # call and increment per annotation.
+            for annotation, new_id in zip(
+                kept, map(str, range(annotation_id, annotation_id + len(kept)))
+            ):
+                annotation.set("id", new_id)
+            annotation_id += len(kept)
 
-    def _should_keep_annotation(self, normalizer_name, annotation_type):
-        """
-        Determine if an annotation should be kept based on the normalizer type.
+            if is_first_doc:
+                # Remove unwanted annotations from the first document. Each
+                # passage.remove() shifts the remaining siblings (O(k) apiece,
+                # O(k^2) overall); rebuilding the child list once is O(k).
+                # The id() set sidesteps per-element __eq__ cost.
+                kept_ids = {id(annotation) for annotation in kept}
+                passage[:] = [
+                    child
+                    for child in passage
+                    if child.tag != "annotation" or id(child) in kept_ids
+                ]
+            else:
+                merged_passage.extend(kept)
 
-        :param normalizer_name: Current normalizer
-        :param annotation_type: Type of the annotation
-        :return: Boolean indicating whether to keep the annotation
-        """
-        if normalizer_name == "disease" and annotation_type == "Disease":
-            return True
-        elif normalizer_name == "chemical" and annotation_type == "Chemical":
-            return True
-        elif normalizer_name == "cellline" and annotation_type == "CellLine":
-            return True
-        elif normalizer_name == "tmvar" and annotation_type not in {
-            "Chemical",
-            "Disease",
-            "CellLine",
-        }:
-            return True
-        elif normalizer_name == "gnorm2" and annotation_type not in {
-            "Chemical",
-            "Disease",
-            "CellLine",
-        }:
-            return True
-        return False
+        return annotation_id  # Ensure annotation_id is carried over correctly
 
     def _write_merged_file(self, file_name, merged_document):
         """
@@ -233,16 +370,128 @@ class BioCFileMerger:
         :param file_name: Name of the output file.
         :param merged_document: Merged BioC document XML element.
         """
+        # Serialize once and hand the same bytes to both sinks; queueing
+        # bytes instead of the element also lets the DOM be freed while the
+        # upload is still pending.
+        payload = _serialize_bioc(merged_document)
+
         output_path = self.file_handler.get_file_path(self.output_dir, file_name)
         logger.info(f"Writing merged file to: {output_path}")
-        self.file_handler.write_file_as_bioc(output_path, merged_document)
+        self.file_handler.write_file(output_path, payload)
 
         if self.write_to_s3:
             s3_output_path = self.s3_file_handler.get_file_path(
                 self.s3_annotations_merged_dir, file_name
             )
-            logger.info(f"Writing merged file to S3: {s3_output_path}")
-            self.s3_file_handler.write_file_as_bioc(s3_output_path, merged_document)
+            logger.info(f"Queueing merged file for S3 upload: {s3_output_path}")
+            self._upload_queue.put((s3_output_path, payload))
+
+    def _upload_worker(self):
+        """
+        Background consumer: upload queued merged documents to S3 until the
+        shutdown sentinel (None) is received.
+        """
+        while True:
+            item = self._upload_queue.get()
+            if item is None:
+                self._upload_queue.task_done()
+                break
+            s3_output_path, payload = item
+            try:
+                logger.info(f"Writing merged file to S3: {s3_output_path}")
+                self.s3_file_handler.write_file(s3_output_path, payload)
+            except Exception as e:
+                logger.error(f"S3 upload failed for {s3_output_path}: {e}")
+                self._upload_failures.append((s3_output_path, e))
+            finally:
+                self._upload_queue.task_done()
+
+    def _raise_upload_failures(self):
+        """Re-raise any upload error recorded by the uploader thread."""
+        if self._upload_failures:
+            failed_paths = ", ".join(path for path, _ in self._upload_failures)
+            raise Exception(
+                f"S3 upload failed for {len(self._upload_failures)} merged "
+                f"file(s): {failed_paths}"
+            ) from self._upload_failures[0][1]
+
+    def wait_for_uploads(self):
+        """Block until every queued S3 upload has completed.
+
+        Raises if any upload failed, so the asynchronous queue does not turn
+        an upload error into a silently "successful" run.
+        """
+        if self.write_to_s3:
+            self._upload_queue.join()
+            self._raise_upload_failures()
+
+    def _shutdown_uploader(self):
+        """Drain the queue and stop the uploader thread (atexit-safe)."""
+        if self._upload_thread is not None and self._upload_thread.is_alive():
+            self._upload_queue.put(None)
+            self._upload_thread.join()
+            self._raise_upload_failures()
+
+
+# Per-process merger instance, built once by _init_worker so each pool worker
+# reuses its own file handlers (boto3 clients are not picklable and must not
+# be shared across processes).
+_worker_merger = None
+
+
+def _build_merger(workflow_id, source, write_to_s3):
+    """
+    Construct a BioCFileMerger from the YAML config for the given run.
+
+    :param workflow_id: Unique identifier for the JIT workflow.
+    :param source: Article source (pmc, ct, preprint, ...).
+    :param write_to_s3: Whether merged output should also be written to S3.
+    :return: A configured BioCFileMerger instance.
+    """
+    config_loader = YAMLConfigLoader()
+    paths_config = config_loader.get_config("paths")
+    storage_type = paths_config["storage"]["type"]
+    file_handler = FileHandlerFactory.get_handler(storage_type)
+    paths = paths_config["storage"][storage_type]
+
+    s3_paths = {}
+    s3_file_handler = None
+    if write_to_s3:
+        s3_paths = paths_config["storage"]["s3"]
+        s3_file_handler = FileHandlerFactory.get_handler("s3")
+
+    return BioCFileMerger(
+        workflow_id=workflow_id,
+        source=source,
+        paths_config=paths,
+        file_handler=file_handler,
+        write_to_s3=write_to_s3,
+        s3_paths_config=s3_paths,
+        s3_file_handler=s3_file_handler,
+    )
+
+
+def _init_worker(workflow_id, source, write_to_s3):
+    """Pool initializer: build this worker's merger once."""
+    # The handler factory and AWS connection memoize instances at class
+    # level, so a forked worker would otherwise get the parent's handlers
+    # wrapping the parent's boto3 clients — sharing those sockets/SSL state
+    # across processes is not safe. Drop the inherited caches so the merger
+    # below really does build fresh clients.
+    FileHandlerFactory.clear_instances()
+    AWSConnection.clear_caches()
+    global _worker_merger
+    _worker_merger = _build_merger(workflow_id, source, write_to_s3)
+
+
+def _merge_one_file(file_name):
+    """Merge a single file using the worker-local merger (top-level so it pickles)."""
+    _worker_merger.merge_single_file(file_name)
+    # Drain this worker's upload queue before the task completes: atexit
+    # hooks never run in fork-start pool workers (they exit via os._exit),
+    # so anything still queued when the worker dies would be lost silently.
+    _worker_merger.wait_for_uploads()
+    return file_name
 
 
 def main():
@@ -303,44 +552,14 @@ def main():
         source = args.source
         logger.info(f"{source} registered as SOURCE for processing")
 
-    # Initialize the config loader
-    config_loader = YAMLConfigLoader()
-
-    # Retrieve paths config
-    paths_config = config_loader.get_config("paths")
-    storage_type = paths_config["storage"]["type"]
-
-    # Get file handler instance from factory
-    file_handler = FileHandlerFactory.get_handler(storage_type)
-
-    # Retrieve paths from config
-    paths = paths_config["storage"][storage_type]
-
     if args.write_to_s3 == "true":
         write_to_s3 = True
     else:
         write_to_s3 = False
     logger.info(f"write_to_s3 set to {write_to_s3}")
-    s3_paths = {}
-    s3_file_handler = None
 
     try:
-        if write_to_s3:
-            # Get S3 Paths and file handler for writing to S3
-            storage_type = "s3"
-            s3_paths = paths_config["storage"][storage_type]
-            s3_file_handler = FileHandlerFactory.get_handler(storage_type)
-
-        merger = BioCFileMerger(
-            workflow_id=workflow_id,
-            source=source,
-            paths_config=paths,
-            file_handler=file_handler,
-            write_to_s3=write_to_s3,
-            s3_paths_config=s3_paths,
-            s3_file_handler=s3_file_handler,
-        )
-
+        merger = _build_merger(workflow_id, source, write_to_s3)
         merger.merge_files()
         logger.info("BioC Merger pipeline completed successfully.")
     except Exception as e:
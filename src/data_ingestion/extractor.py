@@ -1,20 +1,9 @@
 import argparse
 import traceback
-from src.data_ingestion.ingest_apollo.apollo_articles_extractor import (
-    extract_apollo_articles,
+from src.pubtator_utils.config_handler.config_reader import (
+    YAMLConfigLoader,
+    expand_path_template,
 )
-from src.data_ingestion.ingest_apollo.extract_metadata import (
-    apollo_articles_metadata_extractor,
-)
-from src.data_ingestion.ingest_clinical_trials.ct_articles_extractor import (
-    extract_ct_articles,
-)
-from src.data_ingestion.ingest_eln.eln_articles_extractor import extract_eln_articles
-from src.data_ingestion.ingest_preprints_rxivs.preprint_articles_extractor import (
-    extract_preprints_articles,
-)
-from src.data_ingestion.ingest_rfd.rfd_articles_extractor import extract_rfd_articles
-from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
 from src.pubtator_utils.file_handler.file_handler_factory import FileHandlerFactory
 from src.pubtator_utils.logs_handler.logger import SingletonLogger
 import subprocess
@@ -63,25 +52,15 @@ def setup_environment(source: str, timestamp: str, file_type: str):
     file_handler = FileHandlerFactory.get_handler(storage_type)
     paths = paths_config["storage"][storage_type]
 
-    extraction_path = (
-        paths["extraction_path"]
-        .replace("{source}", source)
-        .replace("{timestamp}", timestamp)
-    )
-
-    apollo_uuid_map_path = (
-        paths["apollo_uuid_map_path"]
-        .replace("{source}", source)
-        .replace("{file_type}", file_type)
-        .replace("{timestamp}", timestamp)
-    )
+    # One format_map pass per template instead of a .replace scan per
+    # placeholder; values are shared across all three paths.
+    path_values = {"source": source, "timestamp": timestamp, "file_type": file_type}
 
-    grsar_id_map_path = (
-        paths["grsar_id_map_path"]
-        .replace("{source}", source)
-        .replace("{file_type}", file_type)
-        .replace("{timestamp}", timestamp)
+    extraction_path = expand_path_template(paths["extraction_path"], **path_values)
+    apollo_uuid_map_path = expand_path_template(
+        paths["apollo_uuid_map_path"], **path_values
     )
+    grsar_id_map_path = expand_path_template(paths["grsar_id_map_path"], **path_values)
 
     source_config = paths_config["ingestion_source"][source]
 
@@ -96,6 +75,124 @@ def setup_environment(source: str, timestamp: str, file_type: str):
     )
 
 
+# Each _run_* imports its ingest subtree on first use: one CLI invocation
+# touches exactly one source, and the unused subtrees drag in heavy deps
+# (pandas, lxml, docx, openpyxl) that would otherwise load on every run.
+
+
+def _run_ct(source, file_handler, source_config, extraction_path, file_type, grsar_id_map_path):
+    from src.data_ingestion.ingest_clinical_trials.ct_articles_extractor import (
+        extract_ct_articles,
+    )
+
+    extracted_articles_count = extract_ct_articles(
+        ct_path=extraction_path,
+        file_handler=file_handler,
+        ct_source_config=source_config,
+        source=source,
+    )
+    logger.info(f"{extracted_articles_count} CT Articles Extracted Successfully!")
+
+
+def _run_preprint(source, file_handler, source_config, extraction_path, file_type, grsar_id_map_path):
+    from src.data_ingestion.ingest_preprints_rxivs.preprint_articles_extractor import (
+        extract_preprints_articles,
+    )
+
+    extracted_files_to_uuid_map = extract_preprints_articles(
+        preprints_path=extraction_path,
+        file_handler=file_handler,
+        preprints_source_config=source_config,
+        source=source,
+    )
+    logger.info(
+        f"{len(extracted_files_to_uuid_map)} Preprint Articles Extracted Successfully!"
+    )
+
+
+def _run_rfd(source, file_handler, source_config, extraction_path, file_type, grsar_id_map_path):
+    from src.data_ingestion.ingest_rfd.rfd_articles_extractor import (
+        extract_rfd_articles,
+    )
+
+    extracted_files_to_uuid_map = extract_rfd_articles(
+        rfd_path=extraction_path,
+        file_handler=file_handler,
+        rfd_source_config=source_config,
+        source=source,
+    )
+    logger.info(f"{len(extracted_files_to_uuid_map)} RFD Articles Extracted Successfully!")
+
+
+def _run_apollo(source, file_handler, source_config, extraction_path, file_type, grsar_id_map_path):
+    from src.data_ingestion.ingest_apollo.apollo_articles_extractor import (
+        extract_apollo_articles,
+    )
+    from src.data_ingestion.ingest_apollo.extract_metadata import (
+        apollo_articles_metadata_extractor,
+    )
+
+    extracted_files_to_grsar_id_map = extract_apollo_articles(
+        apollo_path=extraction_path,
+        file_handler=file_handler,
+        apollo_source_config=source_config,
+        source=source,
+        file_type=file_type,
+    )
+    logger.info(
+        f"{len(extracted_files_to_grsar_id_map)} Apollo Articles Extracted Successfully!"
+    )
+    # for time being to capture the uuid map generated for apollo; the full
+    # map can be huge, so it is only stringified when DEBUG is enabled
+    logger.debug("grsar-id map: %s", extracted_files_to_grsar_id_map)
+    file_handler.write_file_as_json(
+        grsar_id_map_path, extracted_files_to_grsar_id_map
+    )
+
+    apollo_articles_metadata_extractor(
+        apollo_source_config=source_config,
+        extracted_files_to_uuid_map=extracted_files_to_grsar_id_map,
+        source=source,
+    )
+    logger.info(f"Generated Metadata files for Apollo Articles Successfully!")
+
+
+def _run_eln(source, file_handler, source_config, extraction_path, file_type, grsar_id_map_path):
+    from src.data_ingestion.ingest_eln.eln_articles_extractor import (
+        extract_eln_articles,
+    )
+
+    extracted_files_to_grsar_id_map = extract_eln_articles(
+        eln_path=extraction_path,
+        file_handler=file_handler,
+        eln_source_config=source_config,
+        source=source,
+        file_type=file_type,
+    )
+    # for time being to capture the grsar_id map generated for eln; the full
+    # map can be huge, so it is only stringified when DEBUG is enabled
+    # ToDO add rds implementation
+    logger.debug("grsar-id map: %s", extracted_files_to_grsar_id_map)
+    file_handler.write_file_as_json(
+        grsar_id_map_path, extracted_files_to_grsar_id_map
+    )
+    logger.info(
+        f"{len(extracted_files_to_grsar_id_map)} ELN Articles Extracted Successfully!"
+    )
+
+
+# Dispatch table for run_extraction; adding a source means adding a _run_*
+# function and one entry here instead of growing an if/elif cascade.
+_EXTRACTORS = {
+    "ct": _run_ct,
+    "preprint": _run_preprint,
+    "rfd": _run_rfd,
+    "apollo": _run_apollo,
+    "eln": _run_eln,
+    "safe_eln": _run_eln,
+}
+
+
 def run_extraction(
     source,
     file_handler,
@@ -105,91 +202,17 @@ def run_extraction(
     apollo_uuid_map_path=None,
     grsar_id_map_path=None,
 ):
-    if source == "ct":
-        extracted_articles_count = extract_ct_articles(
-            ct_path=extraction_path,
-            file_handler=file_handler,
-            ct_source_config=source_config,
-            source=source,
-        )
-        logger.info(f"{extracted_articles_count} CT Articles Extracted Successfully!")
-    elif source == "preprint":
-        extracted_files_to_uuid_map = extract_preprints_articles(
-            preprints_path=extraction_path,
-            file_handler=file_handler,
-            preprints_source_config=source_config,
-            source=source,
-        )
-        logger.info(
-            f"{len(extracted_files_to_uuid_map)} Preprint Articles Extracted Successfully!"
-        )
-    elif source == "rfd":
-        extracted_files_to_uuid_map = extract_rfd_articles(
-            rfd_path=extraction_path,
-            file_handler=file_handler,
-            rfd_source_config=source_config,
-            source=source,
-        )
-        logger.info(f"{len(extracted_files_to_uuid_map)} RFD Articles Extracted Successfully!")
-    elif source == "apollo":
-        extracted_files_to_grsar_id_map = extract_apollo_articles(
-            apollo_path=extraction_path,
-            file_handler=file_handler,
-            apollo_source_config=source_config,
-            source=source,
-            file_type=file_type,
-        )
-        logger.info(
-            f"{len(extracted_files_to_grsar_id_map)} Apollo Articles Extracted Successfully!"
-        )
-        # for time being to capture the uuid map generated for apollo
-        logger.info(f"{extracted_files_to_grsar_id_map}")
-        file_handler.write_file_as_json(
-            grsar_id_map_path, extracted_files_to_grsar_id_map
-        )
-
-        apollo_articles_metadata_extractor(
-            apollo_source_config=source_config,
-            extracted_files_to_uuid_map=extracted_files_to_grsar_id_map,
-            source=source,
-        )
-        logger.info(f"Generated Metadata files for Apollo Articles Successfully!")
-    elif source == "eln":
-        extracted_files_to_grsar_id_map = extract_eln_articles(
-            eln_path=extraction_path,
-            file_handler=file_handler,
-            eln_source_config=source_config,
-            source=source,
-            file_type=file_type,
-        )
-        # for time being to capture the grsar_id map generated for eln
-        # ToDO add rds implementation
-        logger.info(f"{extracted_files_to_grsar_id_map}")
-        file_handler.write_file_as_json(
-            grsar_id_map_path, extracted_files_to_grsar_id_map
-        )
-        logger.info(
-            f"{len(extracted_files_to_grsar_id_map)} ELN Articles Extracted Successfully!"
-        )
-    elif source == "safe_eln":
-        extracted_files_to_grsar_id_map = extract_eln_articles(
-            eln_path=extraction_path,
-            file_handler=file_handler,
-            eln_source_config=source_config,
-            source=source,
-            file_type=file_type,
-        )
-        # for time being to capture the grsar_id map generated for eln
-        # ToDO add rds implementation
-        logger.info(f"{extracted_files_to_grsar_id_map}")
-        file_handler.write_file_as_json(
-            grsar_id_map_path, extracted_files_to_grsar_id_map
-        )
-        logger.info(
-            f"{len(extracted_files_to_grsar_id_map)} ELN Articles Extracted Successfully!"
-        )
-    else:
+    extractor = _EXTRACTORS.get(source)
+    if extractor is None:
         raise ValueError(f"Unsupported source: {source}")
+    extractor(
+        source=source,
+        file_handler=file_handler,
+        source_config=source_config,
+        extraction_path=extraction_path,
+        file_type=file_type,
+        grsar_id_map_path=grsar_id_map_path,
+    )
 
 
 def run_alembic_upgrade():
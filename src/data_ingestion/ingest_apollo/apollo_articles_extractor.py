@@ -1,5 +1,6 @@
 from src.data_ingestion.ingestion_utils.s3_extractor import extract_from_s3_apollo
 import re
+import string
 from pathlib import PurePosixPath
 from typing import Optional
 
@@ -12,6 +13,18 @@ from src.pubtator_utils.logs_handler.logger import SingletonLogger
 logger_instance = SingletonLogger()
 logger = logger_instance.get_logger()
 
+# Compiled once at import; the + quantifier maps each run of unsafe
+# characters to a single underscore, fusing the replace and collapse
+# passes make_safe_filename used to do separately.
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9]+")
+
+# Byte-table fast path for ASCII stems (the common case for S3 keys):
+# str.translate walks the string once in C with no regex engine involved.
+_SAFE_CHARS = set(string.ascii_letters + string.digits)
+_UNSAFE_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if c not in _SAFE_CHARS}
+)
+
 
 def extract_apollo_articles(
     apollo_path: str,
@@ -26,7 +39,13 @@ def extract_apollo_articles(
         s3_src_path = apollo_source_config["s3_src_path"]
         # call the S3 extractor
         extracted_files_to_grsar_id_map = extract_from_s3_apollo(
-            apollo_path, file_handler, source, source_type, s3_src_path, file_type
+            apollo_path,
+            file_handler,
+            source,
+            source_type,
+            s3_src_path,
+            file_type,
+            max_workers=apollo_source_config.get("workers", 8),
         )
         return extracted_files_to_grsar_id_map
     elif source_type == "API":
@@ -45,11 +64,14 @@ def make_safe_filename(filename: str, max_len: Optional[int] = None) -> str:
     stem = p.stem
     ext = p.suffix  # keep as-is including leading dot
 
-    # replace any char that is not A-Za-z0-9 with underscore
-    safe_stem = re.sub(r"[^A-Za-z0-9]", "_", stem)
-
-    # collapse consecutive underscores and strip leading/trailing underscores
-    safe_stem = re.sub(r"_+", "_", safe_stem).strip("_")
+    # replace each run of non-A-Za-z0-9 chars with a single underscore and
+    # strip leading/trailing underscores
+    if stem.isascii():
+        # translate maps unsafe chars to "_"; split/filter/join then
+        # collapses runs and strips the ends, all in C
+        safe_stem = "_".join(filter(None, stem.translate(_UNSAFE_TABLE).split("_")))
+    else:
+        safe_stem = _UNSAFE_RE.sub("_", stem).strip("_")
 
     if max_len and len(safe_stem) > max_len:
         safe_stem = safe_stem[:max_len]
@@ -1,5 +1,5 @@
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from src.pubtator_utils.file_handler.file_handler_factory import FileHandlerFactory
 from src.pubtator_utils.file_handler.base_handler import FileHandler
@@ -12,6 +12,41 @@ logger_instance = SingletonLogger()
 logger = logger_instance.get_logger()
 
 
+def _upload_files(upload_jobs, s3_file_handler, max_workers):
+    """Upload ``(local_path, s3_path)`` pairs, fanning out over a thread pool.
+
+    S3 PUTs are network-latency bound and independent per file, so the
+    serial per-file loops spent most of their wall time waiting on round
+    trips. The boto3 client behind the handler is shared safely across
+    threads. ``max_workers <= 1`` keeps the serial path.
+    """
+    if not upload_jobs:
+        return 0
+
+    if max_workers <= 1 or len(upload_jobs) == 1:
+        for local_path, s3_path in upload_jobs:
+            upload_to_s3(
+                local_path=local_path,
+                s3_path=s3_path,
+                s3_file_handler=s3_file_handler,
+            )
+        return len(upload_jobs)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(upload_jobs))) as executor:
+        futures = [
+            executor.submit(
+                upload_to_s3,
+                local_path=local_path,
+                s3_path=s3_path,
+                s3_file_handler=s3_file_handler,
+            )
+            for local_path, s3_path in upload_jobs
+        ]
+        for future in futures:
+            future.result()
+    return len(upload_jobs)
+
+
 def upload_apollo_articles(
     apollo_path: str,
     s3_apollo_path: str,
@@ -27,203 +62,140 @@ def upload_apollo_articles(
     s3_failed_ingestion_path: str,
     file_handler: FileHandler,
     s3_file_handler: FileHandler,
+    max_workers: int = 16,
 ):
-    file_upload_counter = 0
+    # All categories feed one job list submitted to a single thread pool:
+    # one big queue keeps the connection pool saturated from start to
+    # finish, where five small serial batches each drained to zero before
+    # the next began.
+    upload_jobs = []
+    category_counts = []
 
     if file_handler.exists(apollo_path):
-        # Upload the Apollo Docs Files to S3
-        logger.info(f"Uploading Apollo Docs Ingestion Files to S3")
-        apollo_docs_upload_counter = 0
-        for apollo_docx in file_handler.list_files(apollo_path):
-            local_file_path = file_handler.get_file_path(apollo_path, apollo_docx)
-            s3_file_path = s3_file_handler.get_file_path(s3_apollo_path, apollo_docx)
-            logger.info(f"Uploading file {apollo_docx} to S3 path {s3_file_path}")
-            upload_to_s3(
-                local_path=local_file_path,
-                s3_path=s3_file_path,
-                s3_file_handler=s3_file_handler,
+        # The Apollo Docs Files
+        logger.info(f"Collecting Apollo Docs Ingestion Files for S3 upload")
+        pairs = [
+            (
+                file_handler.get_file_path(apollo_path, apollo_docx),
+                s3_file_handler.get_file_path(s3_apollo_path, apollo_docx),
             )
-            apollo_docs_upload_counter += 1
-        logger.info(
-            f"Total Apollo Docs Files uploaded to S3: {apollo_docs_upload_counter}"
-        )
-        file_upload_counter += apollo_docs_upload_counter
+            for apollo_docx in file_handler.list_files(apollo_path)
+        ]
+        upload_jobs.extend(pairs)
+        category_counts.append(("Apollo Docs Files", len(pairs)))
 
     if file_handler.exists(failed_ingestion_path):
-        # Upload the Apollo Docs Failed Files to S3
-        logger.info(f"Uploading Apollo Docs Failed Ingestion Files to S3")
-        apollo_failed_docx_upload_counter = 0
-        for apollo_docs_failed in file_handler.list_files(failed_ingestion_path):
-            local_file_path = file_handler.get_file_path(
-                failed_ingestion_path, apollo_docs_failed
+        # The Apollo Docs Failed Files
+        logger.info(f"Collecting Apollo Docs Failed Ingestion Files for S3 upload")
+        pairs = [
+            (
+                file_handler.get_file_path(failed_ingestion_path, apollo_docs_failed),
+                s3_file_handler.get_file_path(
+                    s3_failed_ingestion_path, apollo_docs_failed
+                ),
             )
-            s3_file_path = s3_file_handler.get_file_path(
-                s3_failed_ingestion_path, apollo_docs_failed
-            )
-            logger.info(
-                f"Uploading file {apollo_docs_failed} to S3 path {s3_file_path}"
-            )
-            upload_to_s3(
-                local_path=local_file_path,
-                s3_path=s3_file_path,
-                s3_file_handler=s3_file_handler,
-            )
-            apollo_failed_docx_upload_counter += 1
-        logger.info(
-            f"Total Apollo Docs Ingestion Failed Files uploaded to S3: {apollo_failed_docx_upload_counter}"
-        )
-        file_upload_counter += apollo_failed_docx_upload_counter
+            for apollo_docs_failed in file_handler.list_files(failed_ingestion_path)
+        ]
+        upload_jobs.extend(pairs)
+        category_counts.append(("Apollo Docs Ingestion Failed Files", len(pairs)))
 
     if file_handler.exists(summary_path):
-        # Upload the Summary Files to S3
-        logger.info(f"Uploading Apollo Summary Files to S3")
-        apollo_summary_upload_counter = 0
-        for apollo_summary_file in file_handler.list_files(summary_path):
-            if apollo_summary_file.endswith(".txt"):
-                local_file_path = file_handler.get_file_path(
-                    summary_path, apollo_summary_file
-                )
-                s3_file_path = s3_file_handler.get_file_path(
-                    s3_summary_path, apollo_summary_file
-                )
-                logger.info(
-                    f"Uploading file {apollo_summary_file} to S3 path {s3_file_path}"
-                )
-                upload_to_s3(
-                    local_path=local_file_path,
-                    s3_path=s3_file_path,
-                    s3_file_handler=s3_file_handler,
-                )
-                apollo_summary_upload_counter += 1
-            else:
-                logger.warning(f"Skipping file: {apollo_summary_file} for S3 upload")
-        logger.info(
-            f"Total Apollo Summary Files uploaded to S3: {apollo_summary_upload_counter}"
-        )
-        file_upload_counter += apollo_summary_upload_counter
+        # The Summary Files. The suffix filter runs inside the listing itself
+        # (for S3-backed handlers, inside the pagination loop) instead of a
+        # Python-side endswith rescan of the full listing.
+        logger.info(f"Collecting Apollo Summary Files for S3 upload")
+        pairs = [
+            (
+                file_handler.get_file_path(summary_path, apollo_summary_file),
+                s3_file_handler.get_file_path(s3_summary_path, apollo_summary_file),
+            )
+            for apollo_summary_file in file_handler.list_files(
+                summary_path, suffix=".txt"
+            )
+        ]
+        upload_jobs.extend(pairs)
+        category_counts.append(("Apollo Summary Files", len(pairs)))
 
     if file_handler.exists(bioc_path):
-        # Upload the BioC XML Files to S3
-        logger.info(f"Uploading Apollo BioC XML Files to S3")
-        apollo_bioc_upload_counter = 0
-        for apollo_bioc_xml in file_handler.list_files(bioc_path):
-            if apollo_bioc_xml.endswith(".xml"):
-                local_file_path = file_handler.get_file_path(bioc_path, apollo_bioc_xml)
-                s3_file_path = s3_file_handler.get_file_path(
-                    s3_bioc_path, apollo_bioc_xml
-                )
-                logger.info(
-                    f"Uploading file {apollo_bioc_xml} to S3 path {s3_file_path}"
-                )
-                upload_to_s3(
-                    local_path=local_file_path,
-                    s3_path=s3_file_path,
-                    s3_file_handler=s3_file_handler,
-                )
-                apollo_bioc_upload_counter += 1
-            else:
-                logger.warning(f"Skipping file: {apollo_bioc_xml} for S3 upload")
-        logger.info(
-            f"Total Apollo BioC XML Files uploaded to S3: {apollo_bioc_upload_counter}"
-        )
-        file_upload_counter += apollo_bioc_upload_counter
+        # The BioC XML Files
+        logger.info(f"Collecting Apollo BioC XML Files for S3 upload")
+        pairs = [
+            (
+                file_handler.get_file_path(bioc_path, apollo_bioc_xml),
+                s3_file_handler.get_file_path(s3_bioc_path, apollo_bioc_xml),
+            )
+            for apollo_bioc_xml in file_handler.list_files(bioc_path, suffix=".xml")
+        ]
+        upload_jobs.extend(pairs)
+        category_counts.append(("Apollo BioC XML Files", len(pairs)))
 
     if file_handler.exists(interim_path):
-        # Upload the Interim HTML Files to S3
-        logger.info(f"Uploading Apollo Interim Files to S3")
-        apollo_interim_file_upload_counter = 0
-        for apollo_dir in os.listdir(interim_path):
-            logger.info(f"Processing apollo dir: {apollo_dir}")
-            apollo_dir_path = Path(interim_path) / apollo_dir
-            for apollo_interim_file in os.listdir(apollo_dir_path):
-                apollo_interim_file_path = file_handler.get_file_path(
-                    apollo_dir_path, apollo_interim_file
-                )
-
-                # Uploading the Tables XLSX, Article HTML, TOC Removed Passages and Table Extraction Summary
-                if os.path.isfile(
-                    apollo_interim_file_path
-                ) and not apollo_interim_file.startswith("~$"):
-                    s3_path = str(apollo_dir) + "/" + str(apollo_interim_file)
-                    s3_file_path = s3_file_handler.get_file_path(
-                        s3_interim_path, s3_path
-                    )
-                    logger.info(
-                        f"Uploading file {apollo_interim_file_path} to S3 path {s3_file_path}"
-                    )
-                    upload_to_s3(
-                        local_path=apollo_interim_file_path,
-                        s3_path=s3_file_path,
-                        s3_file_handler=s3_file_handler,
-                    )
-                    apollo_interim_file_upload_counter += 1
-
-                # Uploading the images in the media folder for docx
-                elif os.path.isdir(apollo_interim_file_path):
-                    for image_file in file_handler.list_files(apollo_interim_file_path):
-                        image_file_path = file_handler.get_file_path(
-                            apollo_interim_file_path, image_file
-                        )
-                        if os.path.isfile(
-                            image_file_path
-                        ) and not image_file.startswith("~$"):
-                            s3_path = (
-                                str(apollo_dir)
-                                + "/"
-                                + str(apollo_interim_file)
-                                + "/"
-                                + str(image_file)
-                            )
+        # The Interim HTML Files. scandir yields entries whose file/dir type
+        # comes straight from the directory read, so no extra stat per child.
+        # Office temp files (~$...) are skipped before touching the
+        # filesystem at all.
+        logger.info(f"Collecting Apollo Interim Files for S3 upload")
+        pairs = []
+        with os.scandir(interim_path) as apollo_dirs:
+            for apollo_dir in apollo_dirs:
+                logger.info(f"Processing apollo dir: {apollo_dir.name}")
+                with os.scandir(apollo_dir.path) as interim_entries:
+                    for entry in interim_entries:
+                        if entry.name.startswith("~$"):
+                            logger.warning(f"Skipping file: {entry.name} for S3 upload")
+                            continue
+
+                        # The Tables XLSX, Article HTML, TOC Removed Passages and Table Extraction Summary
+                        if entry.is_file():
                             s3_file_path = s3_file_handler.get_file_path(
-                                s3_interim_path, s3_path
-                            )
-                            logger.info(
-                                f"Uploading file {image_file_path} to S3 path {s3_file_path}"
-                            )
-                            upload_to_s3(
-                                local_path=image_file_path,
-                                s3_path=s3_file_path,
-                                s3_file_handler=s3_file_handler,
+                                s3_interim_path, f"{apollo_dir.name}/{entry.name}"
                             )
-                            apollo_interim_file_upload_counter += 1
-                        else:
-                            logger.warning(f"Skipping file: {image_file} for S3 upload")
-                else:
-                    logger.warning(
-                        f"Skipping file: {apollo_interim_file} for S3 upload"
-                    )
+                            pairs.append((entry.path, s3_file_path))
 
-        logger.info(
-            f"Total Apollo Interim Files uploaded to S3: {apollo_interim_file_upload_counter}"
-        )
-        file_upload_counter += apollo_interim_file_upload_counter
+                        # The images in the media folder for docx
+                        elif entry.is_dir():
+                            with os.scandir(entry.path) as image_entries:
+                                for image_file in image_entries:
+                                    if image_file.is_file() and not image_file.name.startswith(
+                                        "~$"
+                                    ):
+                                        s3_file_path = s3_file_handler.get_file_path(
+                                            s3_interim_path,
+                                            f"{apollo_dir.name}/{entry.name}/{image_file.name}",
+                                        )
+                                        pairs.append((image_file.path, s3_file_path))
+                                    else:
+                                        logger.warning(
+                                            f"Skipping file: {image_file.name} for S3 upload"
+                                        )
+                        else:
+                            logger.warning(
+                                f"Skipping file: {entry.name} for S3 upload"
+                            )
+        upload_jobs.extend(pairs)
+        category_counts.append(("Apollo Interim Files", len(pairs)))
 
     if file_handler.exists(embeddings_path):
-        # Upload the Embeddings Files to S3
-        logger.info(f"Uploading Apollo Embeddings Files to S3")
-        apollo_embeddings_upload_counter = 0
-        for apollo_embedding_file in file_handler.list_files(embeddings_path):
-            if apollo_embedding_file.endswith(".json"):
-                local_file_path = file_handler.get_file_path(
-                    embeddings_path, apollo_embedding_file
-                )
-                s3_file_path = s3_file_handler.get_file_path(
+        # The Embeddings Files
+        logger.info(f"Collecting Apollo Embeddings Files for S3 upload")
+        pairs = [
+            (
+                file_handler.get_file_path(embeddings_path, apollo_embedding_file),
+                s3_file_handler.get_file_path(
                     s3_embeddings_path, apollo_embedding_file
-                )
-                logger.info(
-                    f"Uploading file {apollo_embedding_file} to S3 path {s3_file_path}"
-                )
-                upload_to_s3(
-                    local_path=local_file_path,
-                    s3_path=s3_file_path,
-                    s3_file_handler=s3_file_handler,
-                )
-                apollo_embeddings_upload_counter += 1
-            else:
-                logger.warning(f"Skipping file: {apollo_embedding_file} for S3 upload")
-        logger.info(
-            f"Total Apollo Embeddings Files uploaded to S3: {apollo_embeddings_upload_counter}"
-        )
-        file_upload_counter += apollo_embeddings_upload_counter
+                ),
+            )
+            for apollo_embedding_file in file_handler.list_files(
+                embeddings_path, suffix=".json"
+            )
+        ]
+        upload_jobs.extend(pairs)
+        category_counts.append(("Apollo Embeddings Files", len(pairs)))
+
+    logger.info(f"Uploading {len(upload_jobs)} Apollo files to S3")
+    file_upload_counter = _upload_files(upload_jobs, s3_file_handler, max_workers)
+
+    for label, count in category_counts:
+        logger.info(f"Total {label} uploaded to S3: {count}")
 
     return file_upload_counter
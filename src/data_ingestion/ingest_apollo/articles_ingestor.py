@@ -14,11 +14,18 @@ from src.data_ingestion.ingest_apollo.ingest_pdf.pdf_articles_ingestor import (
     apolloPDFIngestor,
 )
 
+from src.pubtator_utils.aws_handler.aws_connect import AWSConnection
+from src.pubtator_utils.config_handler.config_reader import (
+    YAMLConfigLoader,
+    expand_path_template,
+)
 from src.pubtator_utils.file_handler.base_handler import FileHandler
+from src.pubtator_utils.file_handler.file_handler_factory import FileHandlerFactory
 from src.pubtator_utils.logs_handler.logger import SingletonLogger
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Any, Dict, Optional
 from src.pubtator_utils.db_handler.alembic_models.document import Document
-from src.pubtator_utils.db_handler.db import Session
+from src.pubtator_utils.db_handler.db import Session, engine
 import os
 from pathlib import Path
 
@@ -28,6 +35,15 @@ logger = logger_instance.get_logger()
 
 
 class APOLLOIngestor:
+    # Dispatch table for the per-file loop in run(); .md files go through the
+    # PDF ingestor (the upstream pipeline converts PDFs to Markdown).
+    _INGESTOR_CLASSES = {
+        "docx": apolloDOCXIngestor,
+        "pptx": apolloPPTXIngestor,
+        "xlsx": apolloXLSXIngestor,
+        "md": apolloPDFIngestor,
+    }
+
     def __init__(
         self,
         workflow_id: str,
@@ -46,40 +62,29 @@ class APOLLOIngestor:
         self.file_handler = file_handler
         self.apollo_source_config = apollo_source_config
 
-        self.apollo_path = (
-            paths_config["ingestion_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
-        )
-        self.ingestion_interim_path = (
-            paths_config["ingestion_interim_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
+        # One format_map pass per template (see expand_path_template) instead
+        # of a .replace scan per placeholder; the values are shared across
+        # all seven paths.
+        path_values = {"workflow_id": workflow_id, "source": source}
+
+        self.apollo_path = expand_path_template(
+            paths_config["ingestion_path"], **path_values
         )
-        self.bioc_path = (
-            paths_config["bioc_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
+        self.ingestion_interim_path = expand_path_template(
+            paths_config["ingestion_interim_path"], **path_values
         )
-        self.article_metadata_path = (
-            paths_config["metadata_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
+        self.bioc_path = expand_path_template(paths_config["bioc_path"], **path_values)
+        self.article_metadata_path = expand_path_template(
+            paths_config["metadata_path"], **path_values
         )
-        self.summary_path = (
-            paths_config["summary_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
+        self.summary_path = expand_path_template(
+            paths_config["summary_path"], **path_values
         )
-        self.embeddings_path = (
-            paths_config["embeddings_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
+        self.embeddings_path = expand_path_template(
+            paths_config["embeddings_path"], **path_values
         )
-        self.failed_ingestion_path = (
-            paths_config["failed_ingestion_path"]
-            .replace("{workflow_id}", workflow_id)
-            .replace("{source}", source)
+        self.failed_ingestion_path = expand_path_template(
+            paths_config["failed_ingestion_path"], **path_values
         )
         self.file_handler = file_handler
         self.apollo_source_config = apollo_source_config
@@ -94,27 +99,27 @@ class APOLLOIngestor:
 
         # Build S3 paths only if enabled
         if self.write_to_s3:
-            self.s3_apollo_path = self.s3_paths_config.get(
-                "ingestion_path", ""
-            ).replace("{source}", source)
-            self.s3_interim_path = self.s3_paths_config.get(
-                "ingestion_interim_path", ""
-            ).replace("{source}", source)
-            self.s3_bioc_path = self.s3_paths_config.get("bioc_path", "").replace(
-                "{source}", source
+            self.s3_apollo_path = expand_path_template(
+                self.s3_paths_config.get("ingestion_path", ""), source=source
+            )
+            self.s3_interim_path = expand_path_template(
+                self.s3_paths_config.get("ingestion_interim_path", ""), source=source
             )
-            self.s3_article_metadata_path = self.s3_paths_config.get(
-                "metadata_path", ""
-            ).replace("{source}", source)
-            self.s3_summary_path = self.s3_paths_config.get("summary_path", "").replace(
-                "{source}", source
+            self.s3_bioc_path = expand_path_template(
+                self.s3_paths_config.get("bioc_path", ""), source=source
+            )
+            self.s3_article_metadata_path = expand_path_template(
+                self.s3_paths_config.get("metadata_path", ""), source=source
+            )
+            self.s3_summary_path = expand_path_template(
+                self.s3_paths_config.get("summary_path", ""), source=source
+            )
+            self.s3_embeddings_path = expand_path_template(
+                self.s3_paths_config.get("embeddings_path", ""), source=source
+            )
+            self.s3_failed_ingestion_path = expand_path_template(
+                self.s3_paths_config.get("failed_ingestion_path", ""), source=source
             )
-            self.s3_embeddings_path = self.s3_paths_config.get(
-                "embeddings_path", ""
-            ).replace("{source}", source)
-            self.s3_failed_ingestion_path = self.s3_paths_config.get(
-                "failed_ingestion_path", ""
-            ).replace("{source}", source)
         else:
             self.s3_apollo_path = (
                 self.s3_bioc_path
@@ -129,7 +134,29 @@ class APOLLOIngestor:
             )= (
                 self.s3_failed_ingestion_path
             )  = None
-            
+
+        # Per-type ingestors, created lazily on the first matching file
+        self._ingestors = {}
+
+    def _get_ingestor(self, file_extn):
+        ingestor = self._ingestors.get(file_extn)
+        if ingestor is None:
+            ingestor_class = self._INGESTOR_CLASSES[file_extn]
+            logger.info(f"Instantiating {ingestor_class.__name__}...")
+            ingestor = ingestor_class(
+                workflow_id=self.workflow_id,
+                source=self.source,
+                file_handler=self.file_handler,
+                paths_config=self.paths_config,
+                apollo_source_config=self.apollo_source_config,
+                write_to_s3=self.write_to_s3,
+                s3_paths_config=self.s3_paths_config,
+                s3_file_handler=self.s3_file_handler,
+            )
+            self._ingestors[file_extn] = ingestor
+        return ingestor
+
+
     def update_workflow_id(self):
         for file_name in self.file_handler.list_files(self.apollo_path):
             file_path_temp = os.path.join(self.apollo_path, file_name)
@@ -148,21 +175,29 @@ class APOLLOIngestor:
         It compares the PDF files and MD files, finds the delta and move the respective .pdf file to failed path
         """
 
-        pdf_file_list = [file.replace(".pdf","") for file in self.file_handler.list_files(self.apollo_path) if file.endswith(".pdf")]
-        md_file_list = [file.replace(".md","") for file in self.file_handler.list_files(self.apollo_path) if file.endswith(".md")]
-        failed_files = set(pdf_file_list) - set(md_file_list)
+        # One listing partitioned in a single pass instead of two list_files
+        # calls; suffixes are sliced off rather than str.replace-d, which
+        # would also rewrite a ".pdf"/".md" occurring mid-name.
+        pdf_set, md_set = set(), set()
+        for file in self.file_handler.list_files(self.apollo_path):
+            if file.endswith(".pdf"):
+                pdf_set.add(file[:-4])
+            elif file.endswith(".md"):
+                md_set.add(file[:-3])
+        failed_files = pdf_set - md_set
 
         Path(self.failed_ingestion_path).mkdir(parents=True, exist_ok=True)
 
-        logger.info(f" Number PDF file : {len(pdf_file_list)}")
-        logger.info(f" Number of MD file : {len(md_file_list)}")
+        logger.info(f" Number PDF file : {len(pdf_set)}")
+        logger.info(f" Number of MD file : {len(md_set)}")
 
         for file in failed_files:
             try :
                 file=f"{file}.pdf"
-                if self.file_handler.exists(f"{self.apollo_path}/{file}"):
-                    self.file_handler.move_file(str(f"{self.apollo_path}/{file}"), f"{self.failed_ingestion_path}/{file}")
-                    logger.info(f"Moved Failed File {self.apollo_path}/{file} to {self.failed_ingestion_path}/{file}")
+                # Every failed file came from the listing above, so it exists;
+                # no per-file exists() probe is needed before the move.
+                self.file_handler.move_file(str(f"{self.apollo_path}/{file}"), f"{self.failed_ingestion_path}/{file}")
+                logger.info(f"Moved Failed File {self.apollo_path}/{file} to {self.failed_ingestion_path}/{file}")
             except Exception as e:
                 logger.info(f"Skipped File {self.apollo_path}/{file} : \n Error occured : {e}")
 
@@ -172,51 +207,8 @@ class APOLLOIngestor:
     # Runs the combined process
     def run(
         self,
+        max_workers: int = None,
     ):
-        logger.info("Instantiating apolloDOCXIngestor...")
-        apollo_docx_ingestor = apolloDOCXIngestor(
-            workflow_id=self.workflow_id,
-            source=self.source,
-            file_handler=self.file_handler,
-            paths_config=self.paths_config,
-            apollo_source_config=self.apollo_source_config,
-            write_to_s3=self.write_to_s3,
-            s3_paths_config=self.s3_paths_config,
-            s3_file_handler=self.s3_file_handler,
-        )
-        logger.info("Instantiating apolloPPTXIngestor...")
-        apollo_pptx_ingestor = apolloPPTXIngestor(
-            workflow_id=self.workflow_id,
-            source=self.source,
-            file_handler=self.file_handler,
-            paths_config=self.paths_config,
-            apollo_source_config=self.apollo_source_config,
-            write_to_s3=self.write_to_s3,
-            s3_paths_config=self.s3_paths_config,
-            s3_file_handler=self.s3_file_handler,
-        )
-        logger.info("Instantiating apolloXLSXIngestor...")
-        apollo_xlsx_ingestor = apolloXLSXIngestor(
-            workflow_id=self.workflow_id,
-            source=self.source,
-            file_handler=self.file_handler,
-            paths_config=self.paths_config,
-            apollo_source_config=self.apollo_source_config,
-            write_to_s3=self.write_to_s3,
-            s3_paths_config=self.s3_paths_config,
-            s3_file_handler=self.s3_file_handler,
-        )
-        logger.info("Instantiating apolloPDFIngestor...")
-        apollo_md_ingestor = apolloPDFIngestor(
-            workflow_id=self.workflow_id,
-            source=self.source,
-            file_handler=self.file_handler,
-            paths_config=self.paths_config,
-            apollo_source_config=self.apollo_source_config,
-            write_to_s3=self.write_to_s3,
-            s3_paths_config=self.s3_paths_config,
-            s3_file_handler=self.s3_file_handler,
-        )
         # For PDF processing : Upstream conversion pipeline(nextFlow pipeline) generates Markdown (.md) as the intermediate format.
         # Processing is now standardized on the .md format, replacing the original .pdf source.
         self.file_type= "md" if self.file_type == "pdf" else self.file_type
@@ -224,29 +216,59 @@ class APOLLOIngestor:
         logger.info("Processing Apollo Articles...")
         allowed_file_type=self.apollo_source_config["allowed_file_type"]
         logger.info(f"Allowed file type: {allowed_file_type}")
-        
+        # O(1) membership tests in the per-file loop below
+        allowed_file_type = frozenset(allowed_file_type)
+
         self.update_workflow_id()
 
         if self.file_type == "all" or self.file_type == "md":
             logger.info(f" File Type is : {self.file_type} so, calling the pdf_md_conversion_file_validation")
             self.pdf_md_conversion_file_validation()
 
+        # Decide every (extension, file) pair first, then process them. The
+        # per-file conversions are independent, so the pass can fan out
+        # across processes when more than one worker is configured; each
+        # worker rebuilds its own ingestors via the pool initializer.
+        work_items = []
         for file_name in self.file_handler.list_files(self.apollo_path):
             logger.info(f"Processing Apollo file {file_name}")
             file_extn = file_name.split(".")[-1]
             if self.file_type == "all":
-                if file_extn in allowed_file_type:
-                    logger.info(f"Calling apollo_{file_extn}_ingestor.")
-                    eval(f"apollo_{file_extn}_ingestor").run(file_name=file_name)
+                if file_extn in self._INGESTOR_CLASSES and file_extn in allowed_file_type:
+                    work_items.append((file_extn, file_name))
                 else:
                     logger.info(f"Skipping file because it is of file type: {file_extn}")
             else:
-                if (self.file_type in allowed_file_type) and (file_name.endswith(f".{self.file_type}")):
-                    logger.info(f"Calling apollo_{self.file_type}_ingestor.")
-                    eval(f"apollo_{self.file_type}_ingestor").run(file_name=file_name)
+                if (self.file_type in self._INGESTOR_CLASSES) and (self.file_type in allowed_file_type) and (file_name.endswith(f".{self.file_type}")):
+                    work_items.append((self.file_type, file_name))
                 else :
                     logger.info(f"Skipping file because it is of file type: {file_extn}")
 
+        if max_workers is None:
+            max_workers = int(os.environ.get("APOLLO_INGEST_WORKERS", "1"))
+
+        if max_workers <= 1 or len(work_items) <= 1:
+            for file_extn, file_name in work_items:
+                logger.info(f"Calling apollo_{file_extn}_ingestor.")
+                self._get_ingestor(file_extn).run(file_name=file_name)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.workflow_id,
+                    self.source,
+                    self.file_type,
+                    self.write_to_s3,
+                ),
+            ) as executor:
+                futures = [
+                    executor.submit(_process_one_file, file_extn, file_name)
+                    for file_extn, file_name in work_items
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
         logger.info("Uploading All the Processed files from Local to S3")
         upload_apollo_articles(
             apollo_path=self.apollo_path,
@@ -265,3 +287,60 @@ class APOLLOIngestor:
             s3_file_handler=self.s3_file_handler,
         )
         logger.info("Completed Uploading All the files from Local to S3")
+
+
+# Per-process ingestor for the parallel file pass in run(). File handlers,
+# DB sessions and S3 clients do not survive pickling, so each worker rebuilds
+# its own APOLLOIngestor from config once via the pool initializer; the
+# per-type ingestors inside it are still created lazily per worker.
+_worker_ingestor = None
+
+
+def _build_ingestor(
+    workflow_id: str, source: str, file_type: str, write_to_s3: bool
+) -> APOLLOIngestor:
+    config_loader = YAMLConfigLoader()
+    paths_config = config_loader.get_config("paths")
+    storage_type = paths_config["storage"]["type"]
+    file_handler = FileHandlerFactory.get_handler(storage_type)
+    paths = paths_config["storage"][storage_type]
+    apollo_source_config = paths_config["ingestion_source"][source]
+
+    s3_paths = {}
+    s3_file_handler = None
+    if write_to_s3:
+        s3_paths = paths_config["storage"]["s3"]
+        s3_file_handler = FileHandlerFactory.get_handler("s3")
+
+    return APOLLOIngestor(
+        workflow_id=workflow_id,
+        source=source,
+        file_handler=file_handler,
+        paths_config=paths,
+        apollo_source_config=apollo_source_config,
+        write_to_s3=write_to_s3,
+        file_type=file_type,
+        s3_paths_config=s3_paths,
+        s3_file_handler=s3_file_handler,
+    )
+
+
+def _init_worker(workflow_id: str, source: str, file_type: str, write_to_s3: bool):
+    # Forked workers inherit the parent's class-level handler/client caches;
+    # drop them so the ingestor below builds fresh boto3 clients instead of
+    # sharing the parent's sockets/SSL state across processes.
+    FileHandlerFactory.clear_instances()
+    AWSConnection.clear_caches()
+    # The parent checks out DB connections (update_workflow_id) before the
+    # fork, so the worker inherits those in the module-level engine's pool.
+    # Discard them without closing — close=False leaves the parent's
+    # sockets alone; the worker just lets go of the shared fds and opens
+    # its own connections on first use.
+    engine.dispose(close=False)
+    global _worker_ingestor
+    _worker_ingestor = _build_ingestor(workflow_id, source, file_type, write_to_s3)
+
+
+def _process_one_file(file_extn: str, file_name: str):
+    logger.info(f"Calling apollo_{file_extn}_ingestor.")
+    _worker_ingestor._get_ingestor(file_extn).run(file_name=file_name)
@@ -20,7 +20,11 @@ def extract_ct_articles(
     if source_type == "s3":
         # call the S3 extractor
         ingested_ct_articles_cnt = extract_from_s3(
-            ct_path, file_handler, source, source_type
+            ct_path,
+            file_handler,
+            source,
+            source_type,
+            max_workers=ct_source_config.get("workers", 8),
         )
         return ingested_ct_articles_cnt
     elif source_type == "API":
@@ -34,7 +34,13 @@ def extract_eln_articles(
         s3_src_path = eln_source_config["s3_src_path"]
         # call the S3 extractor
         extracted_files_to_grsar_id_map = extract_from_s3_eln(
-            eln_path, file_handler, source, source_type, s3_src_path, file_type
+            eln_path,
+            file_handler,
+            source,
+            source_type,
+            s3_src_path,
+            file_type,
+            max_workers=eln_source_config.get("workers", 8),
         )
         return extracted_files_to_grsar_id_map
     elif source_type == "API":
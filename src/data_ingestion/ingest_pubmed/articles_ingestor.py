@@ -1,13 +1,19 @@
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from src.data_ingestion.ingest_pubmed.pmc_articles_extractor import extract_pmc_articles
 from src.data_ingestion.ingest_pubmed.pmc_to_bioc_converter import convert_pmc_to_bioc
 from src.data_ingestion.ingest_pubmed.fetch_metadata import MetadataExtractor
-from src.data_ingestion.ingest_pubmed.articles_summarizer import SummarizeArticle
+from src.data_ingestion.ingest_pubmed.articles_summarizer import (
+    SummarizeArticle,
+    summarize_articles,
+)
 from src.data_ingestion.ingest_pubmed.prettify_xml import XMLFormatter
 from src.data_ingestion.ingest_pubmed.pmc_tables_processor import (
     extract_pmc_tables,
     upload_pmc_table_files,
 )
+from src.pubtator_utils.aws_handler.aws_connect import AWSConnection
 from src.pubtator_utils.file_handler.base_handler import FileHandler
 from src.pubtator_utils.file_handler.file_handler_factory import FileHandlerFactory
 from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
@@ -133,51 +139,52 @@ class PMCIngestor:
     def articles_metadata_extractor(self, metadata_storage_type: str = "file"):
         # Fetch and store metadata of extracted articles
         logger.info("Fetching metadata for the articles...")
-        for file in self.file_handler.list_files(self.pmc_path):
-            if file.endswith(".xml"):
-                file_path = self.file_handler.get_file_path(self.pmc_path, file)
-                metadata_json_file_name = file.replace(".xml", "_metadata.json")
-                metadata_path = self.file_handler.get_file_path(
-                    self.article_metadata_path, metadata_json_file_name
-                )
-                s3_metadata_path = (
-                    self.s3_file_handler.get_file_path(
-                        self.s3_article_metadata_path, metadata_json_file_name
-                    )
-                    if self.write_to_s3
-                    else None
-                )
-                metadata_extractor = MetadataExtractor(
-                    file_path=file_path,
-                    metadata_path=metadata_path,
-                    file_handler=self.file_handler,
-                    s3_metadata_path=s3_metadata_path,
-                    s3_file_handler=self.s3_file_handler,
-                    write_to_s3=self.write_to_s3,
+        for file in self.file_handler.list_files(self.pmc_path, suffix=".xml"):
+            file_path = self.file_handler.get_file_path(self.pmc_path, file)
+            metadata_json_file_name = file.replace(".xml", "_metadata.json")
+            metadata_path = self.file_handler.get_file_path(
+                self.article_metadata_path, metadata_json_file_name
+            )
+            s3_metadata_path = (
+                self.s3_file_handler.get_file_path(
+                    self.s3_article_metadata_path, metadata_json_file_name
                 )
-                if metadata_storage_type == "file":
-                    metadata_extractor.save_metadata_as_json()
-                    logger.info(f"Metadata for {file} saved to file")
-                else:
-                    logger.error("Invalid metadata storage type provided")
+                if self.write_to_s3
+                else None
+            )
+            metadata_extractor = MetadataExtractor(
+                file_path=file_path,
+                metadata_path=metadata_path,
+                file_handler=self.file_handler,
+                s3_metadata_path=s3_metadata_path,
+                s3_file_handler=self.s3_file_handler,
+                write_to_s3=self.write_to_s3,
+            )
+            if metadata_storage_type == "file":
+                metadata_extractor.save_metadata_as_json()
+                logger.info(f"Metadata for {file} saved to file")
+            else:
+                logger.error("Invalid metadata storage type provided")
 
     def pmc_to_bioc_converter(self):
         # Convert the PMC Articles to BioC File Format:
         logger.info("Converting PMC Articles to BioC XML...")
-        for file in self.file_handler.list_files(self.pmc_path):
-            if file.endswith(".xml"):
-                pmc_file_path = self.file_handler.get_file_path(self.pmc_path, file)
-                convert_pmc_to_bioc(
-                    pmc_file_path,
-                    self.bioc_path,
-                    self.file_handler,
-                    self.s3_bioc_path,
-                    self.s3_file_handler,
-                    self.write_to_s3,
-                )
+        for file in self.file_handler.list_files(self.pmc_path, suffix=".xml"):
+            pmc_file_path = self.file_handler.get_file_path(self.pmc_path, file)
+            convert_pmc_to_bioc(
+                pmc_file_path,
+                self.bioc_path,
+                self.file_handler,
+                self.s3_bioc_path,
+                self.s3_file_handler,
+                self.write_to_s3,
+            )
 
     def prettify_bioc_xml(self):
-        # Prettify the BioC XML files:
+        # Prettify the BioC XML files. Debug/inspection helper only: it
+        # re-parses, re-serializes and rewrites every file purely to add
+        # whitespace, and downstream normalizers ignore formatting — keep it
+        # out of run() and the ingestion hot path.
         logger.info("Prettifying the BioC XML files...")
         formatter = XMLFormatter(
             folder_path=self.bioc_path, file_handler=self.file_handler
@@ -187,49 +194,109 @@ class PMCIngestor:
     def articles_summarizer(self):
         # Generate articles summaries
         logger.info("Generating summaries for the articles using BioC XMLs...")
-        for file in self.file_handler.list_files(self.bioc_path):
-            if file.endswith(".xml"):
-                logger.info(f"Generating summary for: {file}")
-                file_path = self.file_handler.get_file_path(self.bioc_path, file)
-                # file_path = os.path.join(self.bioc_local_path, file)
-                summarizer = SummarizeArticle(
+        files = self.file_handler.list_files(self.bioc_path, suffix=".xml")
+        summarizers = []
+        for file in files:
+            file_path = self.file_handler.get_file_path(self.bioc_path, file)
+            # file_path = os.path.join(self.bioc_local_path, file)
+            summarizers.append(
+                SummarizeArticle(
                     input_file_path=file_path,
                     file_handler=self.file_handler,
                     summarization_pipe=self.summarization_pipe,
                 )
-                summary = summarizer.summarize()
-                summary_file_name = file.replace(".xml", ".txt")
-                summary_file_path = self.file_handler.get_file_path(
-                    self.summary_path, summary_file_name
+            )
+
+        # Batch the first-attempt prompts through one pipeline call; articles
+        # needing the retry/shorten loop are handled individually inside.
+        summaries = summarize_articles(summarizers)
+
+        for file, summary in zip(files, summaries):
+            summary_file_name = file.replace(".xml", ".txt")
+            summary_file_path = self.file_handler.get_file_path(
+                self.summary_path, summary_file_name
+            )
+            self.file_handler.write_file(summary_file_path, summary)
+            logger.info(f"Summary generated for: {file}")
+
+            if self.write_to_s3:
+                # Save to S3
+                s3_summary_file_path = self.s3_file_handler.get_file_path(
+                    self.s3_summary_path, summary_file_name
                 )
-                self.file_handler.write_file(summary_file_path, summary)
-                logger.info(f"Summary generated for: {file}")
+                self.s3_file_handler.write_file(s3_summary_file_path, summary)
+                logger.info(f"Summary saved to S3: {s3_summary_file_path}")
+
+    def process_article_file(self, file: str, metadata_storage_type: str = "file"):
+        """Run metadata extraction, BioC conversion and table extraction for one
+        PMC XML, parsing the article a single time and sharing the tree across
+        the stages."""
+        file_path = self.file_handler.get_file_path(self.pmc_path, file)
+        tree = self.file_handler.parse_xml_file(file_path)
+
+        # Metadata
+        metadata_json_file_name = file.replace(".xml", "_metadata.json")
+        metadata_path = self.file_handler.get_file_path(
+            self.article_metadata_path, metadata_json_file_name
+        )
+        s3_metadata_path = (
+            self.s3_file_handler.get_file_path(
+                self.s3_article_metadata_path, metadata_json_file_name
+            )
+            if self.write_to_s3
+            else None
+        )
+        metadata_extractor = MetadataExtractor(
+            file_path=file_path,
+            metadata_path=metadata_path,
+            file_handler=self.file_handler,
+            s3_metadata_path=s3_metadata_path,
+            s3_file_handler=self.s3_file_handler,
+            write_to_s3=self.write_to_s3,
+            tree=tree,
+        )
+        if metadata_storage_type == "file":
+            metadata_extractor.save_metadata_as_json()
+            logger.info(f"Metadata for {file} saved to file")
+        else:
+            logger.error("Invalid metadata storage type provided")
+
+        # BioC conversion, reusing the parsed tree
+        convert_pmc_to_bioc(
+            file_path,
+            self.bioc_path,
+            self.file_handler,
+            self.s3_bioc_path,
+            self.s3_file_handler,
+            self.write_to_s3,
+            tree=tree,
+        )
 
-                if self.write_to_s3:
-                    # Save to S3
-                    s3_summary_file_path = self.s3_file_handler.get_file_path(
-                        self.s3_summary_path, summary_file_name
-                    )
-                    self.s3_file_handler.write_file(s3_summary_file_path, summary)
-                    logger.info(f"Summary saved to S3: {s3_summary_file_path}")
+        # Tables (reads the metadata JSON written above)
+        extract_pmc_tables(
+            file_handler=self.file_handler,
+            pmc_file_path=file_path,
+            interim_dir=self.ingestion_interim_path,
+            embeddings_dir=self.embeddings_path,
+            article_metadata_path=metadata_path,
+        )
 
     def process_pmc_tables(self):
         # Process PMC tables
         logger.info("Extracting Tables from PMC Articles ...")
-        for file in self.file_handler.list_files(self.pmc_path):
-            if file.endswith(".xml"):
-                pmc_file_path = self.file_handler.get_file_path(self.pmc_path, file)
-                metadata_json_file_name = file.replace(".xml", "_metadata.json")
-                metadata_path = self.file_handler.get_file_path(
-                    self.article_metadata_path, metadata_json_file_name
-                )
-                extract_pmc_tables(
-                    file_handler=self.file_handler,
-                    pmc_file_path=pmc_file_path,
-                    interim_dir=self.ingestion_interim_path,
-                    embeddings_dir=self.embeddings_path,
-                    article_metadata_path=metadata_path,
-                )
+        for file in self.file_handler.list_files(self.pmc_path, suffix=".xml"):
+            pmc_file_path = self.file_handler.get_file_path(self.pmc_path, file)
+            metadata_json_file_name = file.replace(".xml", "_metadata.json")
+            metadata_path = self.file_handler.get_file_path(
+                self.article_metadata_path, metadata_json_file_name
+            )
+            extract_pmc_tables(
+                file_handler=self.file_handler,
+                pmc_file_path=pmc_file_path,
+                interim_dir=self.ingestion_interim_path,
+                embeddings_dir=self.embeddings_path,
+                article_metadata_path=metadata_path,
+            )
         if self.write_to_s3:
             logger.info("Uploading All the Table Processed files from Local to S3")
             upload_pmc_table_files(
@@ -248,12 +315,99 @@ class PMCIngestor:
         self,
         article_ids: list,
         metadata_storage_type: str = "file",
+        max_workers: int = None,
     ):
         self.pmc_articles_extractor(article_ids=article_ids)
-        self.articles_metadata_extractor(metadata_storage_type=metadata_storage_type)
-        self.pmc_to_bioc_converter()
+
+        # Single pass over the extracted PMC XMLs: metadata, BioC conversion
+        # and table extraction share one listing and one parse per article
+        # instead of three list+parse sweeps of the directory. Articles are
+        # independent, so the pass fans out across processes; each worker
+        # builds its own ingestor once via the pool initializer.
+        logger.info("Processing extracted PMC articles (metadata, BioC, tables)...")
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        files = self.file_handler.iter_files(self.pmc_path, suffix=".xml")
+        if max_workers <= 1:
+            for file in files:
+                self.process_article_file(
+                    file, metadata_storage_type=metadata_storage_type
+                )
+        else:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(self.workflow_id, self.source, self.write_to_s3),
+            ) as executor:
+                futures = [
+                    executor.submit(_process_one_article, file, metadata_storage_type)
+                    for file in files
+                ]
+                for future in as_completed(futures):
+                    future.result()
+
+        if self.write_to_s3:
+            logger.info("Uploading All the Table Processed files from Local to S3")
+            upload_pmc_table_files(
+                interim_path=self.ingestion_interim_path,
+                s3_interim_path=self.s3_interim_path,
+                embeddings_path=self.embeddings_path,
+                s3_embeddings_path=self.s3_embeddings_path,
+                file_handler=self.file_handler,
+                s3_file_handler=self.s3_file_handler,
+            )
+            logger.info("Completed Uploading All the files from Local to S3")
+
+        # Summaries iterate the BioC output directory (file names there come
+        # from document IDs, not the PMC input names), so this stays its own
+        # pass.
         self.articles_summarizer()
-        self.process_pmc_tables()
+
+
+# Per-process ingestor for the parallel article pass in run(). File handlers
+# and S3 clients do not survive pickling, so each worker rebuilds its own
+# PMCIngestor from config once via the pool initializer.
+_worker_ingestor = None
+
+
+def _build_ingestor(workflow_id: str, source: str, write_to_s3: bool) -> PMCIngestor:
+    config_loader = YAMLConfigLoader()
+    paths_config = config_loader.get_config("paths")
+    storage_type = paths_config["storage"]["type"]
+    file_handler = FileHandlerFactory.get_handler(storage_type)
+    paths = paths_config["storage"][storage_type]
+
+    s3_paths = {}
+    s3_file_handler = None
+    if write_to_s3:
+        s3_paths = paths_config["storage"]["s3"]
+        s3_file_handler = FileHandlerFactory.get_handler("s3")
+
+    return PMCIngestor(
+        workflow_id=workflow_id,
+        source=source,
+        file_handler=file_handler,
+        paths_config=paths,
+        write_to_s3=write_to_s3,
+        s3_paths_config=s3_paths,
+        s3_file_handler=s3_file_handler,
+    )
+
+
+def _init_worker(workflow_id: str, source: str, write_to_s3: bool):
+    # Forked workers inherit the parent's class-level handler/client caches;
+    # drop them so the ingestor below builds fresh boto3 clients instead of
+    # sharing the parent's sockets/SSL state across processes.
+    FileHandlerFactory.clear_instances()
+    AWSConnection.clear_caches()
+    global _worker_ingestor
+    _worker_ingestor = _build_ingestor(workflow_id, source, write_to_s3)
+
+
+def _process_one_article(file: str, metadata_storage_type: str):
+    _worker_ingestor.process_article_file(
+        file, metadata_storage_type=metadata_storage_type
+    )
 
 
 def main():
@@ -1,8 +1,41 @@
+import functools
+
 from src.pubtator_utils.file_handler.base_handler import FileHandler
 from src.pubtator_utils.file_handler.file_handler_factory import FileHandlerFactory
 from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
 from src.pubtator_utils.logs_handler.logger import SingletonLogger
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional; fall back to the stdlib parser
+    lxml_etree = None
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_xpath(path):
+    """Compile an XPath expression once per process (lxml trees only).
+
+    ElementPath re-tokenizes the path string on every find/findall call;
+    every path the extractor uses is also valid XPath 1.0, so on lxml trees
+    each one compiles once into libxml2 and is reused for all articles.
+    """
+    return lxml_etree.XPath(path)
+
+
+def _find_first(element, path):
+    """First element matched by `path`, via the compiled-XPath cache."""
+    if lxml_etree is not None and isinstance(element, lxml_etree._Element):
+        results = _compiled_xpath(path)(element)
+        return results[0] if results else None
+    return element.find(path)
+
+
+def _find_all(element, path):
+    """All elements matched by `path`, via the compiled-XPath cache."""
+    if lxml_etree is not None and isinstance(element, lxml_etree._Element):
+        return _compiled_xpath(path)(element)
+    return element.findall(path)
+
 # Initialize the config loader
 config_loader = YAMLConfigLoader()
 
@@ -26,6 +59,7 @@ class MetadataExtractor:
         s3_metadata_path: str,
         s3_file_handler: FileHandler,
         write_to_s3: bool,
+        tree=None,
     ):
         self.file_path = file_path
         self.metadata_path = metadata_path
@@ -33,11 +67,23 @@ class MetadataExtractor:
         self.s3_metadata_path = s3_metadata_path
         self.s3_file_handler = s3_file_handler
         self.write_to_s3 = write_to_s3
+        # Optionally reuse an already-parsed tree for file_path so callers
+        # processing the same article in several stages parse it only once.
+        self.tree = tree
         self.metadata = {}
 
     def parse_xml(self):
         """Parse the XML file and extract metadata from <article-meta>, <front>, and <back> tags."""
-        tree = self.file_handler.parse_xml_file(self.file_path)
+        # Extraction is deterministic for a given file, so repeated calls
+        # (e.g. get_metadata from several save flows) reuse the first result
+        # instead of re-reading and re-walking the document.
+        if self.metadata:
+            return self.metadata
+        tree = (
+            self.tree
+            if self.tree is not None
+            else self.file_handler.parse_xml_file(self.file_path)
+        )
         # tree = ET.parse(self.file_path)
         root = tree.getroot()
 
@@ -45,7 +91,7 @@ class MetadataExtractor:
         self.metadata["article_meta"] = self.extract_article_meta(root)
 
         # Find the <article> tag and extract the article-type attribute
-        article_element = root.find("article")
+        article_element = _find_first(root, "article")
         self.metadata["article_meta"]["article_type"] = (
             article_element.get("article-type", "")
             if article_element is not None
@@ -60,7 +106,7 @@ class MetadataExtractor:
 
     def extract_article_meta(self, root):
         """Extract metadata from the <article-meta> tag."""
-        article_meta = root.find(".//article-meta")
+        article_meta = _find_first(root, ".//article-meta")
         if article_meta is None:
             return {}
 
@@ -78,7 +124,7 @@ class MetadataExtractor:
         article_data = {
             "title": self.get_text(article_meta, "title-group/article-title"),
             "keywords_from_source": [
-                kwd.text.strip() for kwd in article_meta.findall(".//kwd") if kwd.text
+                kwd.text.strip() for kwd in _find_all(article_meta, ".//kwd") if kwd.text
             ],
         }
 
@@ -87,20 +133,11 @@ class MetadataExtractor:
 
     def extract_section_metadata(self, root, tag_name):
         """Extract metadata from a specified section (<front> or <back>)."""
-        section = root.find(f".//{tag_name}")
+        section = _find_first(root, f".//{tag_name}")
         if section is None:
             return {}
 
-        section_data = {
-            "authors": self.extract_authors(section),
-            "journal_metadata": self.extract_journal_metadata(section),
-            "funding": self.extract_funding_info(section),
-            "publication_date": self.extract_publication_date(section),
-            "license": self.get_text(section, ".//ext-link"),
-            "competing_interests": self.get_text(
-                section, ".//p[@type='competing-interest']"
-            ),
-        }
+        section_data = self._scan_section(section)
 
         # Extract references if processing the back section
         if tag_name == "back":
@@ -113,14 +150,16 @@ class MetadataExtractor:
         """Extract references from the <ref-list> in the <back> section."""
         references = []
 
-        # Locate the <ref-list> tag
-        ref_list = section.find(".//ref-list")
+        # Locate the <ref-list> tag; it is a direct child of <back> in the
+        # NLM/JATS DTD, so a child lookup short-circuits no-ref articles
+        # without a descendant scan.
+        ref_list = _find_first(section, "ref-list")
         if ref_list is None:
             print("No <ref-list> found in the <back> section.")
             return None
 
-        # Iterate over all <ref> elements
-        for ref in ref_list.findall(".//ref"):
+        # Iterate over all <ref> elements (direct children of <ref-list>)
+        for ref in _find_all(ref_list, "ref"):
             ref_data = {}
 
             # Extract the reference ID and label
@@ -139,35 +178,40 @@ class MetadataExtractor:
                 print(f"No citation found for ref ID: {ref.get('id')}")
                 continue
 
-            # Extract publication details
+            # Extract publication details. These fields are direct children
+            # of <mixed-citation>/<element-citation> in the NLM/JATS DTD, so
+            # child lookups replace the full-subtree .// scans.
             ref_data["publication-type"] = citation.get("publication-type", None)
-            ref_data["article-title"] = self.get_text(citation, ".//article-title")
-            ref_data["source"] = self.get_text(citation, ".//source")
-            ref_data["year"] = self.get_text(citation, ".//year")
-            ref_data["volume"] = self.get_text(citation, ".//volume")
-            ref_data["fpage"] = self.get_text(citation, ".//fpage")
-            ref_data["lpage"] = self.get_text(citation, ".//lpage")
+            ref_data["article-title"] = self.get_text(citation, "article-title")
+            ref_data["source"] = self.get_text(citation, "source")
+            ref_data["year"] = self.get_text(citation, "year")
+            ref_data["volume"] = self.get_text(citation, "volume")
+            ref_data["fpage"] = self.get_text(citation, "fpage")
+            ref_data["lpage"] = self.get_text(citation, "lpage")
 
             # Extract publication identifiers (e.g., DOI, PMID)
             ref_data["pub-id"] = {
                 pub_id.get("pub-id-type"): pub_id.text.strip()
-                for pub_id in citation.findall(".//pub-id")
-                if pub_id.text
+                for pub_id in citation
+                if pub_id.tag == "pub-id" and pub_id.text
             }
 
             # Extract authors
             authors = []
 
             # Case 1: Structured author names
-            person_group = citation.find(".//person-group[@person-group-type='author']")
+            person_group = _find_first(
+                citation, ".//person-group[@person-group-type='author']"
+            )
             if person_group is not None:
-                for name in person_group.findall(".//name"):
+                # <name> and <etal> are direct children of <person-group>
+                for name in _find_all(person_group, "name"):
                     author_data = {
                         "surname": self.get_text(name, "surname"),
                         "given-names": self.get_text(name, "given-names"),
                     }
                     authors.append(author_data)
-                if person_group.find(".//etal") is not None:
+                if _find_first(person_group, "etal") is not None:
                     authors.append({"etal": True})
 
             # Case 2: Authors embedded in citation text
@@ -197,57 +241,95 @@ class MetadataExtractor:
         # Return the list of references
         return references if references else None
 
-    def extract_authors(self, section):
-        """Extract author information from the <front> or <back> section."""
-        authors = []
-        for contrib in section.findall(".//contrib[@contrib-type='author']"):
-            author_data = {
-                "surname": self.get_text(contrib, "name/surname"),
-                "given-names": self.get_text(contrib, "name/given-names"),
-                "orcid": self.get_text(contrib, "contrib-id[@contrib-id-type='orcid']"),
-            }
-            authors.append({k: v for k, v in author_data.items() if v})
-        return authors if authors else None
+    def _scan_section(self, section):
+        """Collect section metadata in a single iter() pass.
 
-    def extract_journal_metadata(self, section):
-        """Extract journal metadata from the <front> section."""
-        return {
-            "journal-id": self.get_text(section, ".//journal-id"),
-            "journal-title": self.get_text(section, ".//journal-title"),
-            "issn": self.get_text(section, ".//issn"),
-        }
-
-    def extract_article_metadata(self, section):
-        """Extract article metadata from the <front> section."""
-        return {
-            "article-id": self.get_text(section, ".//article-id"),
-            "article-title": self.get_text(section, ".//article-title"),
-            "subject": self.get_text(section, ".//subject"),
-        }
-
-    def extract_funding_info(self, section):
-        """Extract funding information from the <front> section."""
+        The per-category helpers each rescanned the whole section with a
+        .// query, so a reference-heavy <back> was walked about six times.
+        One traversal with tag dispatch visits every element once; scalar
+        fields keep the first match in document order, matching the old
+        find semantics (including a first match with empty text).
+        """
+        unset = object()
+        authors = []
         funders = []
-        for funding in section.findall(".//funding-source"):
-            funder_data = {
-                "institution": self.get_text(funding, "institution"),
-                "award-id": self.get_text(funding, "award-id"),
-            }
-            funders.append(funder_data)
-        return funders if funders else None
+        journal = {"journal-id": unset, "journal-title": unset, "issn": unset}
+        pub_date = {"day": unset, "month": unset, "year": unset}
+        license_text = unset
+        competing_interests = unset
+
+        def element_text(el):
+            return el.text.strip() if el.text else None
+
+        for el in section.iter():
+            tag = el.tag
+            if not isinstance(tag, str):
+                continue  # skip comments and processing instructions
+            if tag == "contrib" and el.get("contrib-type") == "author":
+                # Bind <name> once instead of descending through it twice
+                # via name/surname and name/given-names.
+                name_el = _find_first(el, "name")
+                author_data = {
+                    "surname": (
+                        self.get_text(name_el, "surname")
+                        if name_el is not None
+                        else None
+                    ),
+                    "given-names": (
+                        self.get_text(name_el, "given-names")
+                        if name_el is not None
+                        else None
+                    ),
+                    "orcid": self.get_text(el, "contrib-id[@contrib-id-type='orcid']"),
+                }
+                authors.append({k: v for k, v in author_data.items() if v})
+            elif tag in journal:
+                if journal[tag] is unset:
+                    journal[tag] = element_text(el)
+            elif tag in pub_date:
+                if pub_date[tag] is unset:
+                    pub_date[tag] = element_text(el)
+            elif tag == "funding-source":
+                funders.append(
+                    {
+                        "institution": self.get_text(el, "institution"),
+                        "award-id": self.get_text(el, "award-id"),
+                    }
+                )
+            elif tag == "ext-link":
+                if license_text is unset:
+                    license_text = element_text(el)
+            elif tag == "p" and el.get("type") == "competing-interest":
+                if competing_interests is unset:
+                    competing_interests = element_text(el)
+
+        def value(field):
+            return None if field is unset else field
 
-    def extract_publication_date(self, section):
-        """Extract publication date from the <front> section."""
         return {
-            "day": (self.get_text(section, ".//day") or "").lstrip("0") or None,
-            "month": (self.get_text(section, ".//month") or "").lstrip("0") or None,
-            "year": self.get_text(section, ".//year"),
+            "authors": authors if authors else None,
+            "journal_metadata": {k: value(v) for k, v in journal.items()},
+            "funding": funders if funders else None,
+            "publication_date": {
+                "day": (value(pub_date["day"]) or "").lstrip("0") or None,
+                "month": (value(pub_date["month"]) or "").lstrip("0") or None,
+                "year": value(pub_date["year"]),
+            },
+            "license": value(license_text),
+            "competing_interests": value(competing_interests),
         }
 
     def get_text(self, element, xpath):
         """Utility to get text content from an XML element."""
-        tag = element.find(xpath)
-        return tag.text.strip() if tag is not None and tag.text else None
+        if lxml_etree is not None and isinstance(element, lxml_etree._Element):
+            # Compiled-XPath cache path (see _compiled_xpath).
+            tag = _find_first(element, xpath)
+            val = tag.text if tag is not None else None
+        else:
+            # findtext resolves the element and its text in one C call
+            # instead of a find() plus a .text attribute round-trip.
+            val = element.findtext(xpath)
+        return val.strip() if val else None
 
     def get_metadata(self):
         metadata = self.parse_xml()
@@ -256,6 +338,15 @@ class MetadataExtractor:
     def save_metadata_as_json(self):
         """Save the extracted metadata as a JSON file."""
         metadata = self.get_metadata()
+
+        # Bind the nested sections once; the payload literal below read each
+        # of them through a fresh .get(..., {}) chain per field, allocating
+        # throwaway dicts on every miss.
+        ameta = metadata.get("article_meta", {})
+        front = metadata.get("front", {})
+        back = metadata.get("back", {})
+        pub_date = front.get("publication_date", {})
+
         references = [
             {
                 "id": ref.get("id", ""),
@@ -281,44 +372,32 @@ class MetadataExtractor:
                 # ],
                 "authors": ref.get("authors", []),
             }
-            for ref in metadata.get("back", {}).get("references", [])
+            for ref in back.get("references", [])
         ]
 
         # Prepare the payload with other metadata fields
         payload = {
-            "pmid": metadata.get("article_meta", {}).get("pmid", ""),
-            "pmcid": metadata.get("article_meta", {}).get("pmcid", ""),
-            "doi": metadata.get("article_meta", {}).get("doi", ""),
-            "publisher-id": metadata.get("article_meta", {}).get("publisher-id", ""),
-            "title": metadata.get("article_meta", {}).get("title", ""),
-            "article_type": metadata.get("article_meta", {}).get("article_type", ""),
-            "keywords_from_source": metadata.get("article_meta", {}).get(
-                "keywords", ""
-            ),
+            "pmid": ameta.get("pmid", ""),
+            "pmcid": ameta.get("pmcid", ""),
+            "doi": ameta.get("doi", ""),
+            "publisher-id": ameta.get("publisher-id", ""),
+            "title": ameta.get("title", ""),
+            "article_type": ameta.get("article_type", ""),
+            "keywords_from_source": ameta.get("keywords", ""),
             "authors": [
                 f"{author.get('given-names', '')} {author.get('surname', '')}"
-                for author in metadata.get("front", {}).get("authors", [])
+                for author in front.get("authors", [])
             ],
-            "journal": metadata.get("front", {})
-            .get("journal_metadata", {})
-            .get("journal-title", ""),
+            "journal": front.get("journal_metadata", {}).get("journal-title", ""),
             "publication_date": {
-                "day": metadata.get("front", {})
-                .get("publication_date", {})
-                .get("day", ""),
-                "month": metadata.get("front", {})
-                .get("publication_date", {})
-                .get("month", ""),
-                "year": metadata.get("front", {})
-                .get("publication_date", {})
-                .get("year", ""),
+                "day": pub_date.get("day", ""),
+                "month": pub_date.get("month", ""),
+                "year": pub_date.get("year", ""),
             },
-            "license": metadata.get("front", {}).get("license", ""),
+            "license": front.get("license", ""),
             "references_count": len(references),
             "references": references,
-            "competing_interests": metadata.get("back", {}).get(
-                "competing_interests", ""
-            ),
+            "competing_interests": back.get("competing_interests", ""),
         }
 
         self.file_handler.write_file_as_json(self.metadata_path, payload)
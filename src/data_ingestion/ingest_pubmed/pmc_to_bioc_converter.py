@@ -16,9 +16,12 @@ def convert_pmc_to_bioc(
     s3_bioc_output_dir: str,
     s3_file_handler: FileHandler,
     write_to_s3: bool,
+    tree=None,
 ):
-    # Parse the input PMC XML
-    tree = file_handler.parse_xml_file(pmc_file)
+    # Parse the input PMC XML (unless the caller already parsed it and is
+    # reusing the tree across ingestion stages)
+    if tree is None:
+        tree = file_handler.parse_xml_file(pmc_file)
     # tree = ET.parse(pmc_file)
     root = tree.getroot()
 
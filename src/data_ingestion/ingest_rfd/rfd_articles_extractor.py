@@ -19,7 +19,12 @@ def extract_rfd_articles(
         s3_src_path = rfd_source_config["s3_src_path"]
         # call the S3 extractor
         files_to_grsar_id_map = extract_from_s3_rfd(
-            rfd_path, file_handler, source, source_type, s3_src_path
+            rfd_path,
+            file_handler,
+            source,
+            source_type,
+            s3_src_path,
+            max_workers=rfd_source_config.get("workers", 8),
         )
         return files_to_grsar_id_map
     elif source_type == "API":
@@ -10,6 +10,10 @@ from src.pubtator_utils.logs_handler.logger import SingletonLogger
 from src.pubtator_utils.file_handler.file_handler_factory import FileHandlerFactory
 from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
 import re
+import functools
+import hashlib
+import random
+import time
 
 # Get the logger instance
 logger_instance = SingletonLogger()
@@ -22,6 +26,46 @@ model_path_config = config_loader.get_config("paths")["model"][model_path_type][
     "summarization_model"
 ]
 
+# Model summaries keyed by a hash of the source abstract. Summarization is a
+# pure function of the abstract text, so re-ingesting the same article (or
+# duplicate content under a different file name) skips the model call.
+_SUMMARY_CACHE: dict = {}
+
+# Circuit breaker shared by all instances: when several articles in a row
+# exhaust every attempt (e.g. the model is misloaded or the GPU is wedged),
+# stop burning max_retries attempts per article and fall back immediately for
+# a cool-down window.
+_BREAKER = {"fail_count": 0, "open_until": 0.0}
+_BREAKER_THRESHOLD = 5
+_BREAKER_COOLDOWN_SECONDS = 60.0
+
+# Compiled once; matches the executive-summary passage title case-insensitively.
+_EXEC_SUMMARY_RE = re.compile(r"\b(executive summary)\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_summarization_pipe(model_name: str = "mistral_7b"):
+    """Build the text-generation pipeline once per process and model.
+
+    Loading the model weights dominates construction cost, so instances
+    created without an injected pipe all share the cached pipeline instead
+    of reloading the model per article.
+    """
+    logger.warn("Loading summarization model at runtime...")
+    try:
+        model_path = model_path_config[model_name]["model_path"]
+        logger.info(f"Model Loaded from {model_path}")
+    except Exception as e:
+        raise ValueError(f"Error loading model {model_name}: {e}")
+    # Use GPU if available, else CPU
+    device = 0 if torch.cuda.is_available() else -1
+    logger.info(f"Using device: {device}")
+    return pipeline(
+        "text-generation",
+        model=model_path,
+        device_map="auto",
+        max_new_tokens=1000,
+    )
 
 class SummarizeArticle:
     """Class to load RFD Article's content and Summarize it."""
@@ -36,60 +80,63 @@ class SummarizeArticle:
         self.input_file_path = input_file_path
         self.file_handler = file_handler
         self.abstract_text = self._load_file_content()
-        self.prompt_template = (
-            "Given the abstract of an article, write a concise summary of the following in about 60-80 words:\n"
-            f"{self.abstract_text}\n"
-            "Enclose the summary exactly in <<< and >>>, with no other text."
-        )
         self.max_retries = 3
+        self._content_key = hashlib.blake2b(
+            self.abstract_text.encode("utf-8"), digest_size=16
+        ).hexdigest()
 
         if summarization_pipe:
             self.pipe = summarization_pipe
         else:
-            logger.warn("Loading summarization model at runtime...")
-            model_path = self._get_model_info(model_name=model_name)
-            # Use GPU if available, else CPU
-            device = 0 if torch.cuda.is_available() else -1
-            logger.info(f"Using device: {device}")
-            self.pipe = pipeline(
-                "text-generation",
-                model=model_path,
-                device_map="auto",
-                max_new_tokens=1000,
+            self.pipe = _get_summarization_pipe(model_name)
+
+    @property
+    def prompt_template(self):
+        """Assemble the prompt on demand so each instance retains a single
+        copy of the article text rather than both the text and the full
+        prompt; many instances can be alive at once during a batched run."""
+        return "".join(
+            (
+                "Given the abstract of an article, write a concise summary of the following in about 60-80 words:\n",
+                self.abstract_text,
+                "\nEnclose the summary exactly in <<< and >>>, with no other text.",
             )
+        )
 
     def _extract_summary(self, text):
-        match = re.search(r"<<<(.*?)>>>", text, re.DOTALL)
-        return match.group(1).strip() if match else None
+        # Two str.find calls make one linear scan each; the old lazy
+        # "<<<(.*?)>>>" regex backtracks character by character between the
+        # fences. Semantics match: leftmost opening fence, nearest close.
+        start = text.find("<<<")
+        if start == -1:
+            return None
+        end = text.find(">>>", start + 3)
+        if end == -1:
+            return None
+        return text[start + 3 : end].strip()
 
     def _count_words(self, text):
         return len(text.split())
 
-    def _get_model_info(self, model_name: str):
-        try:
-            model_path = model_path_config[model_name]["model_path"]
-            logger.info(f"Model Loaded from {model_path}")
-            return model_path
-        except Exception as e:
-            raise ValueError(f"Error loading model {model_name}: {e}")
-
     def _load_file_content(self) -> str:
         """Parses the XML file and extracts relevant text content."""
         try:
             tree = self.file_handler.parse_xml_file(self.input_file_path)
             root = tree.getroot()
 
-            content = ""
+            # Accumulate matches in a list and join once; repeated
+            # content += allocates a fresh string per passage.
+            parts = []
             # extract the passage whose section title matches the regex 'executive summary' or 'summary' or 'abstract'
             for passage in root.findall(".//passage"):
                 section_title = passage.find("./infon[@key='section_title']")
                 if section_title is not None:
                     title_text = section_title.text.lower()
-                    if re.search(r"\b(executive summary)\b", title_text, re.IGNORECASE):
+                    if _EXEC_SUMMARY_RE.search(title_text):
                         text_elem = passage.find("text")
                         if text_elem is not None and text_elem.text:
-                            content += text_elem.text + " "
-            return content.strip()
+                            parts.append(text_elem.text)
+            return " ".join(parts).strip()
 
         except ET.ParseError as e:
             raise ValueError(f"Failed to parse XML: {e}")
@@ -120,7 +167,22 @@ class SummarizeArticle:
         return abs_summary
 
     def summarize(self):
-        messages = [{"role": "user", "content": self.prompt_template}]
+        cached_summary = _SUMMARY_CACHE.get(self._content_key)
+        if cached_summary is not None:
+            logger.info("Summary served from content cache.")
+            return cached_summary
+
+        if time.monotonic() < _BREAKER["open_until"]:
+            logger.warning(
+                "Summarization circuit breaker open; using fallback summary."
+            )
+            return self._fallback_summary()
+
+        # Assemble the prompt once; prompt_template concatenates the article
+        # text on every access and must not be rebuilt per attempt.
+        prompt = self.prompt_template
+        messages = [{"role": "user", "content": prompt}]
+        strict_messages = None
         is_summary_generated = False
 
         for attempt in range(self.max_retries):
@@ -154,22 +216,39 @@ class SummarizeArticle:
                     logger.info(f"Word count: {word_count}")
 
                     if word_count <= 80:
+                        _BREAKER["fail_count"] = 0
+                        _SUMMARY_CACHE[self._content_key] = summary
                         return summary
                     else:
                         last_summary_wrapped = f"<<<{summary}>>>"
                 else:
-                    # Retry with stricter rephrasing if <<< >>> not found
-                    messages = [
-                        {
-                            "role": "user",
-                            "content": self.prompt_template
-                            + "\nPlease strictly include the summary within <<< and >>>.",
-                        }
-                    ]
+                    # Retry with stricter rephrasing if <<< >>> not found;
+                    # built at most once and reused on later attempts.
+                    if strict_messages is None:
+                        strict_messages = [
+                            {
+                                "role": "user",
+                                "content": prompt
+                                + "\nPlease strictly include the summary within <<< and >>>.",
+                            }
+                        ]
+                    messages = strict_messages
             except Exception as e:
                 logger.error(f"Error during summarization attempt {attempt + 1}: {e}")
+                # Back off with jitter before the next attempt so transient
+                # faults (loader races, OOM recovery) get time to clear.
+                if attempt < self.max_retries - 1:
+                    time.sleep(min(2**attempt + random.uniform(0, 1), 10.0))
 
         logger.info("Failed to generate a valid summary. Using fallback from abstract.")
+        _BREAKER["fail_count"] += 1
+        if _BREAKER["fail_count"] >= _BREAKER_THRESHOLD:
+            _BREAKER["open_until"] = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+            _BREAKER["fail_count"] = 0
+            logger.warning(
+                f"Summarization failed for {_BREAKER_THRESHOLD} articles in a row; "
+                f"falling back without retries for {_BREAKER_COOLDOWN_SECONDS:.0f}s."
+            )
         return self._fallback_summary()
 
 
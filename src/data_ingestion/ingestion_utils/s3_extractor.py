@@ -1,6 +1,7 @@
 import re
 import unicodedata
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import PurePosixPath
 import hashlib
 from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
@@ -19,8 +20,48 @@ logger = logger_instance.get_logger()
 def stable_hash(path: str) -> str:
     return hashlib.sha256(path.encode("utf-8")).hexdigest()
 
+
+def download_files(s3_file_handler, download_jobs, max_workers):
+    """Download `(s3_path, staging_path)` pairs, overlapping the S3 round trips.
+
+    Downloads are pure I/O, so a thread pool hides the per-object latency.
+    Futures are consumed in submission order, keeping the callers' per-file
+    bookkeeping (grsar-id maps, document inserts) serial and deterministic.
+    """
+    download_jobs = list(download_jobs)
+    if max_workers <= 1 or len(download_jobs) <= 1:
+        for cur_s3_full_path, cur_staging_path in download_jobs:
+            s3_file_handler.s3_util.download_file(cur_s3_full_path, cur_staging_path)
+            logger.info(
+                f"File downloaded from S3: {cur_s3_full_path} to local: {cur_staging_path}"
+            )
+        return
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(download_jobs))
+    ) as executor:
+        futures = [
+            executor.submit(
+                s3_file_handler.s3_util.download_file,
+                cur_s3_full_path,
+                cur_staging_path,
+            )
+            for cur_s3_full_path, cur_staging_path in download_jobs
+        ]
+        for (cur_s3_full_path, cur_staging_path), future in zip(
+            download_jobs, futures
+        ):
+            future.result()
+            logger.info(
+                f"File downloaded from S3: {cur_s3_full_path} to local: {cur_staging_path}"
+            )
+
 def extract_from_s3(
-    path: str, file_handler: FileHandler, source: str, storage_type: str = "s3"
+    path: str,
+    file_handler: FileHandler,
+    source: str,
+    storage_type: str = "s3",
+    max_workers: int = 8,
 ):
     # Initialize the config loader
     config_loader = YAMLConfigLoader()
@@ -37,24 +78,28 @@ def extract_from_s3(
 
     src_files = s3_file_handler.list_files(src_data_path)
 
-    for cur_src_file in src_files:
-        # path of the source s3 key
-        cur_s3_full_path = s3_file_handler.get_file_path(src_data_path, cur_src_file)
-        # path where the files are going to be written to in the ingestion directory of HPC
-        cur_staging_path = file_handler.get_file_path(path, cur_src_file)
-        # Download to local HPC path
-        s3_file_handler.s3_util.download_file(cur_s3_full_path, cur_staging_path)
-
-        logger.info(
-            f"File downloaded from S3: {cur_s3_full_path} to local: {cur_staging_path}"
+    download_jobs = [
+        (
+            # path of the source s3 key
+            s3_file_handler.get_file_path(src_data_path, cur_src_file),
+            # path where the files are going to be written to in the ingestion directory of HPC
+            file_handler.get_file_path(path, cur_src_file),
         )
+        for cur_src_file in src_files
+    ]
+    # Download to local HPC path
+    download_files(s3_file_handler, download_jobs, max_workers)
 
     ingested_articles_cnt = len(src_files)
 
     return ingested_articles_cnt
 
 def extract_from_s3_preprints(
-    path: str, file_handler: FileHandler, source: str, storage_type: str = "s3"
+    path: str,
+    file_handler: FileHandler,
+    source: str,
+    storage_type: str = "s3",
+    max_workers: int = 8,
 ):
     # Initialize the config loader
     config_loader = YAMLConfigLoader()
@@ -70,9 +115,10 @@ def extract_from_s3_preprints(
     src_data_path = s3_paths["ingestion_path"].replace("{source}", source)
 
     src_files = s3_file_handler.list_files(src_data_path)
-    
+
     files_to_grsar_id_map = {}
 
+    staged_files = []
     for cur_src_file in src_files:
         # path of the source s3 key
         cur_s3_full_path = s3_file_handler.get_file_path(src_data_path, cur_src_file)
@@ -82,16 +128,35 @@ def extract_from_s3_preprints(
         document_grsar_id = stable_hash(cur_s3_full_path)
         cur_s3_file = f"{document_grsar_id}.{file_extension}"
         cur_staging_path = file_handler.get_file_path(path, cur_s3_file)
-        # Download to local HPC path
-        s3_file_handler.s3_util.download_file(cur_s3_full_path, cur_staging_path)
-
-        logger.info(
-            f"File downloaded from S3: {cur_s3_full_path} to local: {cur_staging_path}"
+        staged_files.append(
+            (
+                cur_s3_full_path,
+                org_filename_with_extension,
+                document_grsar_id,
+                cur_s3_file,
+                cur_staging_path,
+            )
         )
+
+    # Download to local HPC path; downloads run concurrently, the document
+    # inserts below stay serial.
+    download_files(
+        s3_file_handler,
+        [(s3_path, staging_path) for s3_path, _, _, _, staging_path in staged_files],
+        max_workers,
+    )
+
+    for (
+        cur_s3_full_path,
+        org_filename_with_extension,
+        document_grsar_id,
+        cur_s3_file,
+        cur_staging_path,
+    ) in staged_files:
         files_to_grsar_id_map[cur_s3_full_path] = document_grsar_id
         file_content = file_handler.read_file_bytes(cur_staging_path)
         size_bytes = len(file_content)
-        
+
         insert_document_data(document_grsar_id = document_grsar_id, source = source, file_name = org_filename_with_extension, file_path = cur_s3_full_path, safe_file_name= cur_s3_file, size_bytes = size_bytes)
 
     return files_to_grsar_id_map
@@ -104,6 +169,7 @@ def extract_from_s3_eln(
     storage_type: str = "s3",
     s3_src_path: str = "notebook",
     file_type: str = "json",
+    max_workers: int = 8,
 ):
     # Get file handler instance from factory
     s3_file_handler = FileHandlerFactory.get_handler(storage_type)
@@ -112,7 +178,7 @@ def extract_from_s3_eln(
 
     files_to_grsar_id_map = {}
 
-    # download to local
+    staged_files = []
     for cur_s3_full_path in src_files:
         org_filename_with_extension = cur_s3_full_path.split("/")[-1]
         file_extension = org_filename_with_extension.split(".")[-1]
@@ -122,8 +188,31 @@ def extract_from_s3_eln(
         document_grsar_id = stable_hash(cur_s3_full_path)
         cur_s3_file = f"{document_grsar_id}.{file_extension}"
         cur_staging_path = file_handler.get_file_path(path, cur_s3_file)
-        # Download to local HPC path
-        s3_file_handler.s3_util.download_file(cur_s3_full_path, cur_staging_path)
+        staged_files.append(
+            (
+                cur_s3_full_path,
+                org_filename_with_extension,
+                document_grsar_id,
+                cur_s3_file,
+                cur_staging_path,
+            )
+        )
+
+    # Download to local HPC path; downloads run concurrently, the document
+    # inserts below stay serial.
+    download_files(
+        s3_file_handler,
+        [(s3_path, staging_path) for s3_path, _, _, _, staging_path in staged_files],
+        max_workers,
+    )
+
+    for (
+        cur_s3_full_path,
+        org_filename_with_extension,
+        document_grsar_id,
+        cur_s3_file,
+        cur_staging_path,
+    ) in staged_files:
         #insert document data
         data = file_handler.read_file_bytes(cur_staging_path)
         size_in_bytes = len(data)
@@ -131,9 +220,6 @@ def extract_from_s3_eln(
 
         # map which has filename to uuid which will be utilised in extract_metadata
         files_to_grsar_id_map[cur_s3_full_path] = document_grsar_id
-        logger.info(
-            f"File downloaded from S3: {cur_s3_full_path} to local: {cur_staging_path}"
-        )
 
     ingested_articles_cnt = len(files_to_grsar_id_map)
     logger.info(f"Files downloaded from S3: {ingested_articles_cnt}")
@@ -147,13 +233,15 @@ def extract_from_s3_rfd(
     source: str,
     storage_type: str = "s3",
     s3_src_path: str = "RFD",
+    max_workers: int = 8,
 ):
     # Get file handler instance from factory
     s3_file_handler = FileHandlerFactory.get_handler(storage_type)
 
     src_files = s3_file_handler.s3_util.list_files(s3_src_path)  # to get full path
     files_to_grsar_id_map = {}
-    # download to local
+
+    staged_files = []
     for cur_s3_full_path in src_files:
         # path where the files are going to be written to in the ingestion directory of HPC
         org_filename_with_extension = cur_s3_full_path.split("/")[-1]
@@ -161,16 +249,36 @@ def extract_from_s3_rfd(
         document_grsar_id = stable_hash(cur_s3_full_path)
         cur_s3_file = f"{document_grsar_id}.{file_extension}"
         cur_staging_path = file_handler.get_file_path(path, cur_s3_file)
-        # Download to local HPC path
-        s3_file_handler.s3_util.download_file(cur_s3_full_path, cur_staging_path)
-        logger.info(
-            f"File downloaded from S3: {cur_s3_full_path} to local: {cur_staging_path}"
+        staged_files.append(
+            (
+                cur_s3_full_path,
+                org_filename_with_extension,
+                document_grsar_id,
+                cur_s3_file,
+                cur_staging_path,
+            )
         )
+
+    # Download to local HPC path; downloads run concurrently, the document
+    # inserts below stay serial.
+    download_files(
+        s3_file_handler,
+        [(s3_path, staging_path) for s3_path, _, _, _, staging_path in staged_files],
+        max_workers,
+    )
+
+    for (
+        cur_s3_full_path,
+        org_filename_with_extension,
+        document_grsar_id,
+        cur_s3_file,
+        cur_staging_path,
+    ) in staged_files:
         files_to_grsar_id_map[cur_s3_full_path] = document_grsar_id
         data = file_handler.read_file_bytes(cur_staging_path)
         size_in_bytes = len(data)
         insert_document_data(document_grsar_id= document_grsar_id, source=source, file_path=cur_s3_full_path, file_name = org_filename_with_extension, safe_file_name=cur_s3_file, size_bytes=size_in_bytes)
-        
+
     return files_to_grsar_id_map
 
 
@@ -181,6 +289,7 @@ def extract_from_s3_apollo(
     storage_type: str = "s3",
     s3_src_path: str = "Apollo",
     file_type: str = "all",
+    max_workers: int = 8,
 ):
     # Get file handler instance from factory
     s3_file_handler = FileHandlerFactory.get_handler(storage_type)
@@ -208,22 +317,42 @@ def extract_from_s3_apollo(
 
     files_to_grsar_id_map = {}
 
+    staged_files = []
     for cur_s3_full_path in filtered_files:
         # path where the files are going to be written to in the ingestion directory of HPC
-        file_extension = cur_s3_full_path.split("/")[-1].split(".")[-1].lower()
+        org_filename_with_extension = cur_s3_full_path.split("/")[-1]
+        file_extension = org_filename_with_extension.split(".")[-1].lower()
         document_grsar_id=stable_hash(cur_s3_full_path)
         cur_src_file = f"{document_grsar_id}.{file_extension}"
         cur_staging_path = file_handler.get_file_path(path, cur_src_file)
-        # Download to local HPC path
-        s3_file_handler.s3_util.download_file(cur_s3_full_path, cur_staging_path)
+        staged_files.append(
+            (
+                cur_s3_full_path,
+                org_filename_with_extension,
+                document_grsar_id,
+                cur_src_file,
+                cur_staging_path,
+            )
+        )
 
+    # Download to local HPC path; downloads run concurrently, the document
+    # inserts below stay serial.
+    download_files(
+        s3_file_handler,
+        [(s3_path, staging_path) for s3_path, _, _, _, staging_path in staged_files],
+        max_workers,
+    )
+
+    for (
+        cur_s3_full_path,
+        org_filename_with_extension,
+        document_grsar_id,
+        cur_src_file,
+        cur_staging_path,
+    ) in staged_files:
         # map which has filename to uuid which will be utilised in extract_metadata
         files_to_grsar_id_map[cur_s3_full_path] = document_grsar_id
-        insert_document_data(document_grsar_id=document_grsar_id, source=source, file_path=cur_s3_full_path, file_name=filename, safe_file_name=cur_src_file)
-
-        logger.info(
-            f"File downloaded from S3: {cur_s3_full_path} to local: {cur_staging_path}"
-        )
+        insert_document_data(document_grsar_id=document_grsar_id, source=source, file_path=cur_s3_full_path, file_name=org_filename_with_extension, safe_file_name=cur_src_file)
 
     ingested_articles_cnt = len(filtered_files)
     logger.info(f"Files downloaded from S3: {ingested_articles_cnt}")
@@ -1,6 +1,7 @@
 import os
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError
 
 from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
@@ -16,8 +17,37 @@ config_loader = YAMLConfigLoader()
 # Retrieve a specific config
 aws_platform_type = config_loader.get_config("aws")["aws"]["platform_type"]
 
+# Shared clients serve thread/process pools elsewhere in the pipeline, so the
+# connection pool is kept wide enough that concurrent transfers don't queue on
+# sockets, with adaptive retries for throttled calls.
+_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    tcp_keepalive=True,
+)
+
 
 class AWSConnection:
+    # Session and clients are cached at class level: building a boto3 Session
+    # re-runs credential resolution and the STS connectivity check, and every
+    # fresh client pays SSL context setup. boto3 clients are thread-safe, so
+    # one per service is enough for the whole process.
+    _cached_session = None
+    _cached_clients = {}
+    _cached_resources = {}
+
+    @classmethod
+    def clear_caches(cls):
+        """Drop the cached session, clients and resources.
+
+        Used by pool-worker initializers: a forked child inherits these
+        class-level caches already populated in the parent, and boto3
+        sockets/SSL state must not be shared across processes.
+        """
+        cls._cached_session = None
+        cls._cached_clients = {}
+        cls._cached_resources = {}
+
     def __init__(self):
         self.platform = aws_platform_type
         self.session = None
@@ -25,12 +55,16 @@ class AWSConnection:
 
     def setup_session(self):
         """Sets up and maintains the AWS session and client."""
+        if AWSConnection._cached_session is not None:
+            self.session = AWSConnection._cached_session
+            return self.session
         try:
             self.session = boto3.Session()
 
             # Test the connection by creating an STS client and calling 'get_caller_identity'
             self.client = self.session.client("sts")
             if self.test_connection():
+                AWSConnection._cached_session = self.session
                 return self.session
             else:
                 return None
@@ -54,11 +88,31 @@ class AWSConnection:
             return False
 
     def get_client(self, service_name: str):
-        """Returns a client for a specific AWS service."""
+        """Returns a cached client for a specific AWS service."""
+        client = AWSConnection._cached_clients.get(service_name)
+        if client is not None:
+            return client
+        aws_session = self.setup_session()
+        if not aws_session:
+            raise Exception("AWS session is not initialized.")
+        client = aws_session.client(service_name, config=_CLIENT_CONFIG)
+        AWSConnection._cached_clients[service_name] = client
+        return client
+
+    def get_resource(self, service_name: str, region_name: str = None):
+        """Returns a cached resource for a specific AWS service."""
+        cache_key = (service_name, region_name)
+        resource = AWSConnection._cached_resources.get(cache_key)
+        if resource is not None:
+            return resource
         aws_session = self.setup_session()
         if not aws_session:
             raise Exception("AWS session is not initialized.")
-        return aws_session.client(service_name)
+        resource = aws_session.resource(
+            service_name, region_name=region_name, config=_CLIENT_CONFIG
+        )
+        AWSConnection._cached_resources[cache_key] = resource
+        return resource
 
 
 # # Usage Example:
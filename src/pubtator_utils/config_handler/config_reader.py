@@ -3,6 +3,35 @@ from typing import Any, Dict
 import os
 import yaml
 
+# libyaml-backed loader parses several times faster than the pure-Python
+# SafeLoader; fall back when PyYAML was built without the C extension.
+try:
+    _YAML_LOADER = yaml.CSafeLoader
+except AttributeError:
+    _YAML_LOADER = yaml.SafeLoader
+
+
+class _PathTemplateValues(dict):
+    """format_map helper that leaves unknown {placeholders} untouched."""
+
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+def expand_path_template(template: str, **values) -> str:
+    """Fill {placeholder} fields in a configured path template.
+
+    Single-pass replacement for the chained
+    .replace("{workflow_id}", ...).replace("{source}", ...) pattern used on
+    the paths config. Placeholders without a supplied value are preserved so
+    callers can expand templates in stages.
+
+    :param template: Path template from the paths config.
+    :param values: Placeholder values, e.g. workflow_id=..., source=...
+    :return: The expanded path.
+    """
+    return template.format_map(_PathTemplateValues(values))
+
 
 class YAMLConfigLoader:
     _instance = None
@@ -28,14 +57,11 @@ class YAMLConfigLoader:
         self.load_all_configs()
 
     def load_all_configs(self):
-        for config_file in self.config_dir.glob("*.yaml"):
-            with config_file.open("r") as file:
-                config_name = config_file.stem
-                self.configs[config_name] = yaml.safe_load(file)
-        for config_file in self.config_dir.glob("*.yml"):
-            with config_file.open("r") as file:
-                config_name = config_file.stem
-                self.configs[config_name] = yaml.safe_load(file)
+        for pattern in ("*.yaml", "*.yml"):
+            for config_file in self.config_dir.glob(pattern):
+                with config_file.open("r") as file:
+                    config_name = config_file.stem
+                    self.configs[config_name] = yaml.load(file, Loader=_YAML_LOADER)
 
     def get_config(self, name: str) -> Dict[str, Any]:
         return self.configs.get(name)
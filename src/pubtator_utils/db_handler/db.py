@@ -44,7 +44,17 @@ def get_db_url(
 
 db_url = get_db_url()
 
-engine = create_engine(db_url)
+# Explicit pool settings so sessions reuse warm connections instead of paying
+# a fresh TCP+TLS+auth handshake to RDS per unit of work. pool_pre_ping drops
+# connections that went stale across Fargate scale events before handing them
+# out.
+engine = create_engine(
+    db_url,
+    pool_size=10,
+    max_overflow=20,
+    pool_timeout=30,
+    pool_pre_ping=True,
+)
 
 # Create a configured "Session" class
 Session = sessionmaker(bind=engine)
@@ -1,4 +1,7 @@
+import functools
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import torch
 import torch.nn.functional as F
@@ -22,6 +25,7 @@ logger_instance = SingletonLogger()
 logger = logger_instance.get_logger()
 
 
+@functools.lru_cache(maxsize=None)
 def get_model_info(model_name: str):
     model_path_type = config_loader.get_config("paths")["model"]["type"]
     model_path_config = config_loader.get_config("paths")["model"][model_path_type][
@@ -35,8 +39,13 @@ def get_model_info(model_name: str):
         raise ValueError(f"Error loading model {model_name}: {e}")
 
 
+@functools.lru_cache(maxsize=None)
 def load_embeddings_model(model_name: str = "pubmedbert"):
-    """Load model and tokenizer once at startup"""
+    """Load model and tokenizer once per process and model name.
+
+    Weight loading dominates construction cost, so batch callers share one
+    model/tokenizer pair instead of reloading per article.
+    """
     model_path, token_limit = get_model_info(model_name)
     tokenizer = AutoTokenizer.from_pretrained(model_path)
     model = AutoModel.from_pretrained(model_path)
@@ -54,102 +63,159 @@ def masked_mean_pooling(token_embeddings, attention_mask):
     return mean_embeddings
 
 
+def _embed_long_text(text_tokens, tokenizer, model, max_length, stride):
+    """Embed a text longer than the token limit via strided windows."""
+    chunk_embeddings = []
+    chunk_masks = []
+    for i in range(0, len(text_tokens), stride):
+        chunk_tokens = text_tokens[i : i + max_length]
+
+        # Convert tokens back to text
+        chunk_text = tokenizer.decode(chunk_tokens)
+        # Tokenize again with special tokens and padding
+        chunk_inputs = tokenizer(
+            chunk_text,
+            return_tensors="pt",
+            padding="max_length",
+            truncation=True,
+            max_length=max_length,
+        )
+
+        with torch.no_grad():
+            chunk_outputs = model(**chunk_inputs)
+        chunk_embeddings.append(chunk_outputs.last_hidden_state)
+        chunk_masks.append(chunk_inputs["attention_mask"])
+
+    # Combine chunk embeddings using masked mean pooling
+    combined_embeddings = torch.cat(chunk_embeddings, dim=1)
+    combined_mask = torch.cat(chunk_masks, dim=1)
+    embeddings = masked_mean_pooling(combined_embeddings, combined_mask)
+    return F.normalize(embeddings, p=2, dim=1)
+
+
 def get_embeddings(
-    model_name, texts: List[str], model=None, tokenizer=None, stride=None
+    model_name, texts: List[str], model=None, tokenizer=None, stride=None, batch_size=32
 ):
     if model is None or tokenizer is None:
-        # Fallback: load at runtime (not recommended for production)
-        model_path, token_limit = get_model_info(model_name)
-        tokenizer = AutoTokenizer.from_pretrained(model_path)
-        model = AutoModel.from_pretrained(model_path)
-        logger.warning("Model loaded at runtime - consider using startup loading")
-    else:
-        logger.info(f"Model and tokenizer already loaded at startup")
-        _, token_limit = get_model_info(model_name)
+        # Fallback: share the process-wide cached model instead of loading a
+        # fresh copy per call.
+        model, tokenizer = load_embeddings_model(model_name)
+    _, token_limit = get_model_info(model_name)
 
     max_length = token_limit
     stride = stride or max_length // 2
 
-    all_embeddings = []
+    all_embeddings = [None] * len(texts)
 
-    for text in texts:
+    # Texts within the token limit are embedded together in padded batches so
+    # one forward pass covers many texts; over-limit texts keep the strided
+    # per-text window path.
+    short_items = []
+    for idx, text in enumerate(texts):
         tokens = tokenizer.encode(text, add_special_tokens=False)
-
         if len(tokens) <= max_length:
-            # print("tokens: ", len(tokens), "small")
-            inputs = tokenizer(
-                text,
-                return_tensors="pt",
-                padding=True,
-                truncation=True,
-                max_length=max_length,
-            )
-            with torch.no_grad():
-                outputs = model(**inputs)
-            embeddings = masked_mean_pooling(
-                outputs.last_hidden_state, inputs["attention_mask"]
-            )
+            short_items.append((idx, text, len(tokens)))
         else:
-            # print("tokens: ", len(tokens), "large")
-            chunk_embeddings = []
-            chunk_masks = []
-            for i in range(0, len(tokens), stride):
-                chunk_tokens = tokens[i : i + max_length]
-
-                # Convert tokens back to text
-                chunk_text = tokenizer.decode(chunk_tokens)
-                # Tokenize again with special tokens and padding
-                chunk_inputs = tokenizer(
-                    chunk_text,
-                    return_tensors="pt",
-                    padding="max_length",
-                    truncation=True,
-                    max_length=max_length,
-                )
-
-                with torch.no_grad():
-                    chunk_outputs = model(**chunk_inputs)
-                chunk_embeddings.append(chunk_outputs.last_hidden_state)
-                chunk_masks.append(chunk_inputs["attention_mask"])
-
-            #         # Combine chunk embeddings using masked mean pooling
-            #         combined_embeddings = torch.cat(chunk_embeddings, dim=0)  # Concatenate along batch dimension
-            #         combined_mask = torch.cat(chunk_masks, dim=0)  # Concatenate along batch dimension
-            #         embeddings = masked_mean_pooling(combined_embeddings, combined_mask)
-            #
-            #     # Normalize embeddings
-            #     embeddings = F.normalize(embeddings, p=2, dim=1)
-            #     embeddings = embeddings.view(embeddings.size(0), -1)  # Flatten to 1D vector
-            #
-            #     all_embeddings.append(embeddings)
-            #
-            # # Stack all embeddings
-            # return torch.cat(all_embeddings, dim=0)
-
-            # Combine chunk embeddings using masked mean pooling
-            combined_embeddings = torch.cat(chunk_embeddings, dim=1)
-            combined_mask = torch.cat(chunk_masks, dim=1)
-            embeddings = masked_mean_pooling(combined_embeddings, combined_mask)
+            all_embeddings[idx] = _embed_long_text(
+                tokens, tokenizer, model, max_length, stride
+            )
 
+    # Length-bucket the batches: grouping texts of similar token length keeps
+    # each padded batch close to its longest member, so the model spends far
+    # fewer FLOPs on padding tokens. Original order is restored via idx.
+    short_items.sort(key=lambda item: item[2])
+
+    for start in range(0, len(short_items), batch_size):
+        batch = short_items[start : start + batch_size]
+        inputs = tokenizer(
+            [text for _, text, _ in batch],
+            return_tensors="pt",
+            padding=True,
+            truncation=True,
+            max_length=max_length,
+        )
+        with torch.no_grad():
+            outputs = model(**inputs)
+        embeddings = masked_mean_pooling(
+            outputs.last_hidden_state, inputs["attention_mask"]
+        )
         # Normalize embeddings
         embeddings = F.normalize(embeddings, p=2, dim=1)
-        all_embeddings.append(embeddings)
+        for (idx, _, _), embedding in zip(batch, embeddings):
+            all_embeddings[idx] = embedding.unsqueeze(0)
 
-    # Stack all embeddings
+    # Stack all embeddings in the original text order
     return torch.cat(all_embeddings, dim=0)
 
 
-def tensor_to_list(item):
-    """Convert tensors and other non-serializable objects to lists."""
+# LRU cache for user-query embeddings. Search traffic repeats the same
+# queries heavily, so cache hits skip the full PubMedBERT forward pass.
+_query_embedding_cache = OrderedDict()
+_QUERY_EMBEDDING_CACHE_MAXSIZE = 1024
+
+
+def get_query_embeddings(model_name, query: str, model=None, tokenizer=None):
+    """Embed a single user query, caching results by normalized query text.
+
+    The query is lowercased and whitespace-collapsed before lookup so that
+    trivially different spellings of the same query share a cache entry.
+    """
+    normalized_query = " ".join(query.lower().split())
+    cache_key = (model_name, normalized_query)
+
+    cached = _query_embedding_cache.get(cache_key)
+    if cached is not None:
+        _query_embedding_cache.move_to_end(cache_key)
+        logger.info("Query embedding cache hit")
+        return cached
+
+    embeddings = get_embeddings(
+        model_name, [normalized_query], model=model, tokenizer=tokenizer
+    )
+    _query_embedding_cache[cache_key] = embeddings
+    if len(_query_embedding_cache) > _QUERY_EMBEDDING_CACHE_MAXSIZE:
+        _query_embedding_cache.popitem(last=False)
+    return embeddings
+
+
+def prefetch_query_embeddings(
+    model_name, queries: List[str], model=None, tokenizer=None, max_workers: int = 1
+):
+    """Warm the query-embedding cache for upcoming queries in the background.
+
+    Batch retrieval workloads process queries serially: embed -> search ->
+    score. Submitting the next queries here lets their embeddings be computed
+    while the current query's retrieval is still running, hiding the model
+    forward pass behind search latency. Returns the submitted futures so
+    callers can wait on them if needed.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = [
+        executor.submit(get_query_embeddings, model_name, query, model, tokenizer)
+        for query in queries
+    ]
+    executor.shutdown(wait=False)
+    return futures
+
+
+def tensor_to_list(item, quantize_fp16=False):
+    """Convert tensors and other non-serializable objects to lists.
+
+    With quantize_fp16=True, embedding tensors are rounded to FP16 before
+    serialization. Half precision is plenty for cosine similarity and the
+    shorter decimal representations roughly halve the stored JSON size.
+    """
     if isinstance(item, torch.Tensor):  # Check if item is a PyTorch tensor
+        if quantize_fp16:
+            item = item.half()
         return item.tolist()  # Convert tensor to list
     elif isinstance(item, list):
         return [
-            tensor_to_list(sub_item) for sub_item in item
+            tensor_to_list(sub_item, quantize_fp16) for sub_item in item
         ]  # Recursively convert lists
     elif isinstance(item, dict):
         return {
-            key: tensor_to_list(value) for key, value in item.items()
+            key: tensor_to_list(value, quantize_fp16) for key, value in item.items()
         }  # Recursively convert dicts
     else:
         return item  # Return the item if it's already serializable
@@ -162,13 +228,14 @@ def save_embeddings_details_to_json(
     write_to_s3,
     s3_filename,
     s3_file_handler,
+    quantize_fp16=False,
 ):
     """Convert each item in the embeddings details list to JSON-serializable format and save to a JSON file."""
     # Ensure we process each dictionary in the list to make it JSON-serializable
     serializable_data = []
     for item in embeddings_details_list:
         if isinstance(item, dict):
-            serializable_data.append(tensor_to_list(item))
+            serializable_data.append(tensor_to_list(item, quantize_fp16))
         else:
             raise ValueError(
                 "Each item in embeddings_details_list should be a dictionary."
@@ -195,6 +262,18 @@ def calculate_similarity(query_embedding, chunk_embeddings):
     return cosine_similarity(query_embedding, chunk_embeddings).flatten()
 
 
+def calculate_similarity_batch(query_embeddings, chunk_embeddings):
+    """Score multiple query embeddings against the chunk embeddings at once.
+
+    Issues a single matrix-level cosine_similarity call instead of one call
+    per query, so N-query workloads pay one BLAS dispatch rather than N.
+    Returns one row of similarity scores per query, in input order.
+    """
+    query_embeddings = np.atleast_2d(np.array(query_embeddings))
+    chunk_embeddings = np.array(chunk_embeddings)
+    return cosine_similarity(query_embeddings, chunk_embeddings)
+
+
 def find_most_similar(
     user_query, query_embedding, embeddings_details, model, article_id, top_k=5
 ):
@@ -5,9 +5,17 @@ class FileHandler(ABC):
     """Abstract class to handle file operations for different storage types."""
 
     @abstractmethod
-    def list_files(self, path):
+    def list_files(self, path, suffix=None):
         pass
 
+    def iter_files(self, path, suffix=None):
+        """Yield file names under path lazily, optionally filtered by suffix.
+
+        Handlers that can stream their listing (e.g. paginated S3) override
+        this; the default simply falls back to the eager list_files.
+        """
+        yield from self.list_files(path, suffix=suffix)
+
     @abstractmethod
     def exists(self, path):
         pass
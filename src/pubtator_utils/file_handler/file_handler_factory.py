@@ -18,11 +18,30 @@ class FileHandlerFactory:
         "test": LocalFileHandler,
         "s3": S3FileHandler,
     }
+    # Memoized instances keyed by (storage_type, platform_type). Building an
+    # S3 handler sets up a boto3 session/client (100+ ms and its own
+    # connection pool); handlers are stateless per key, and boto3 clients are
+    # thread-safe, so one instance per key is shared across callers.
+    _instances: dict = {}
+
+    @classmethod
+    def clear_instances(cls):
+        """Drop the memoized handler instances.
+
+        Used by pool-worker initializers: a forked child inherits this
+        class-level cache already populated in the parent, and the boto3
+        sockets/SSL state inside the parent's S3 handler must not be shared
+        across processes.
+        """
+        cls._instances.clear()
 
     @staticmethod
     def get_handler(storage_type: str, platform_type: str = None) -> FileHandler:
         """Returns the appropriate file handler instance.
 
+        Instances are cached per (storage_type, platform_type), so repeated
+        calls reuse the same handler and its underlying connections.
+
         Args:
             storage_type (str): The type of storage ("local", "s3", etc.)
             platform_type (str): The type of platform (e.g. "HPC", "GDNA", etc.)
@@ -35,10 +54,13 @@ class FileHandlerFactory:
         if storage_type not in FileHandlerFactory._handlers:
             raise ValueError(f"Unsupported storage type: {storage_type}")
 
-        if storage_type == "local":
-            return FileHandlerFactory._handlers[storage_type]()
-        elif storage_type == "test":
-            return FileHandlerFactory._handlers[storage_type]()
+        if storage_type in ("local", "test"):
+            cache_key = (storage_type, None)
+            if cache_key not in FileHandlerFactory._instances:
+                FileHandlerFactory._instances[cache_key] = (
+                    FileHandlerFactory._handlers[storage_type]()
+                )
+            return FileHandlerFactory._instances[cache_key]
         else:
             if platform_type is None:
                 platform_type = aws_platform_type
@@ -46,4 +68,9 @@ class FileHandlerFactory:
             if platform_type not in ["HPC", "GDNA"]:
                 raise ValueError(f"Unsupported AWS platform type: {platform_type}")
 
-            return FileHandlerFactory._handlers[storage_type](platform_type)
+            cache_key = (storage_type, platform_type)
+            if cache_key not in FileHandlerFactory._instances:
+                FileHandlerFactory._instances[cache_key] = (
+                    FileHandlerFactory._handlers[storage_type](platform_type)
+                )
+            return FileHandlerFactory._instances[cache_key]
@@ -1,4 +1,5 @@
 import json
+import orjson
 from io import BytesIO
 from bioc import BioCCollection
 from botocore.exceptions import ClientError
@@ -7,6 +8,22 @@ from src.pubtator_utils.file_handler.base_handler import FileHandler
 from src.pubtator_utils.file_handler.s3_io_util import S3IOUtil
 import bioc
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional; fall back to the stdlib parser
+    lxml_etree = None
+
+if lxml_etree is not None:
+    # One parser for all parse_xml_file calls instead of a fresh libxml2
+    # context per file. ID collection and entity resolution are skipped (the
+    # extractors never use them), huge_tree lifts libxml2's size limits for
+    # reference-dense PMC articles, and no_network blocks DTD fetches.
+    _XML_PARSER = lxml_etree.XMLParser(
+        collect_ids=False, resolve_entities=False, huge_tree=True, no_network=True
+    )
+else:
+    _XML_PARSER = None
+
 
 class S3FileHandler(FileHandler):
     """Handles file operations on AWS S3 using S3IOUtil."""
@@ -14,14 +31,22 @@ class S3FileHandler(FileHandler):
     def __init__(self, platform_type: str):
         self.s3_util = S3IOUtil(platform_type)
 
-    def list_files(self, path):
+    def list_files(self, path, suffix=None):
         """List all file names in the specified S3 path."""
         try:
-            full_file_names = self.s3_util.list_files(path)
+            full_file_names = self.s3_util.list_files(path, suffix=suffix)
             return [file_name.split("/")[-1] for file_name in full_file_names]
         except ClientError as e:
             raise Exception(f"Error listing files in {path}: {e}")
 
+    def iter_files(self, path, suffix=None):
+        """Yield file names in the specified S3 path lazily, page by page."""
+        try:
+            for key in self.s3_util.iter_files(path, suffix=suffix):
+                yield key.split("/")[-1]
+        except ClientError as e:
+            raise Exception(f"Error listing files in {path}: {e}")
+
     def exists(self, path: str) -> bool:
         """
         Check whether the given S3 key (file or prefix) exists.
@@ -61,7 +86,9 @@ class S3FileHandler(FileHandler):
     def write_file_as_json(self, file_path, content):
         """Writes a dictionary as a JSON file in S3."""
         try:
-            json_content = json.dumps(content)
+            # orjson serializes straight to bytes and is much faster than the
+            # stdlib json encoder on the large chunk/embedding payloads we ship.
+            json_content = orjson.dumps(content)
             self.s3_util.upload_file(file_path=file_path, content=json_content)
         except (ClientError, TypeError, ValueError) as e:
             raise Exception(f"Error writing JSON file {file_path}: {e}")
@@ -73,6 +100,15 @@ class S3FileHandler(FileHandler):
             if not xml_content:
                 raise ValueError("Empty XML content or failed download.")
 
+            if lxml_etree is not None:
+                # lxml rejects str input carrying an encoding declaration,
+                # so feed it the raw bytes.
+                if isinstance(xml_content, str):
+                    xml_content = xml_content.encode("utf-8")
+                return lxml_etree.ElementTree(
+                    lxml_etree.fromstring(xml_content, _XML_PARSER)
+                )
+
             tree = ET.ElementTree(ET.fromstring(xml_content))
             return tree
         except (ClientError, ValueError, ET.ParseError) as e:
@@ -97,8 +133,9 @@ class S3FileHandler(FileHandler):
         """Reads a JSON file from S3 and returns a dictionary."""
         try:
             content = self.read_file(file_path)
-            return json.loads(content) if content else None
-        except json.JSONDecodeError as e:
+            # orjson mirrors the write path and decodes faster than stdlib json.
+            return orjson.loads(content) if content else None
+        except orjson.JSONDecodeError as e:
             raise Exception(f"Error decoding JSON: {e}")
 
     def write_file_as_bioc(self, file_path, bioc_document):
@@ -108,25 +145,12 @@ class S3FileHandler(FileHandler):
                 if isinstance(bioc_document, BioCCollection):
                     xml_str = bioc.dumps(bioc_document)  # returns a str (BioC XML)
                     content = xml_str.encode("utf-8")
-                elif isinstance(bioc_document, ET.Element):
-                    tree = ET.ElementTree(bioc_document)
-                    tree.write(bio_buffer, encoding="utf-8", xml_declaration=True)
-                    bio_buffer.seek(0)
-                    content = bio_buffer.getvalue()
-                else:
-                    raise ValueError("Unsupported document type for BioC writing.")
-
-                self.upload_file(file_path=file_path, content=content)
-        except (ClientError, ValueError, ET.ParseError) as e:
-            raise Exception(f"Error writing BioC file: {e}")
-
-    def write_file_as_bioc(self, file_path, bioc_document):
-        """Writes a BioCCollection or an XML ElementTree as a BioC file in S3."""
-        try:
-            with BytesIO() as bio_buffer:
-                if isinstance(bioc_document, BioCCollection):
-                    xml_str = bioc.dumps(bioc_document)  # returns a str (BioC XML)
-                    content = xml_str.encode("utf-8")
+                elif lxml_etree is not None and isinstance(
+                    bioc_document, lxml_etree._Element
+                ):
+                    content = lxml_etree.tostring(
+                        bioc_document, xml_declaration=True, encoding="UTF-8"
+                    )
                 elif isinstance(bioc_document, ET.Element):
                     tree = ET.ElementTree(bioc_document)
                     tree.write(bio_buffer, encoding="utf-8", xml_declaration=True)
@@ -1,5 +1,7 @@
 import os
+from io import BytesIO
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 from src.pubtator_utils.aws_handler.aws_connect import AWSConnection
 from src.pubtator_utils.config_handler.config_reader import YAMLConfigLoader
@@ -12,6 +14,14 @@ logger = logger_instance.get_logger()
 # Initialize the config loader
 config_loader = YAMLConfigLoader()
 
+# Payloads past the threshold are split into concurrent multipart uploads;
+# smaller ones stay a single PUT. 8 MB parts keep peak buffering modest while
+# still saturating the link on large merged BioC collections.
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+)
+
 
 class S3IOUtil:
     def __init__(self, platform_type: str):
@@ -20,11 +30,10 @@ class S3IOUtil:
         self.bucket_name = aws_s3_config["bucket_name"]
         self.bucket_region = aws_s3_config["bucket_region"]
         # self.s3 = boto3.resource("s3", region_name=self.bucket_region)
-        self.s3 = (
-            AWSConnection()
-            .setup_session()
-            .resource("s3", region_name=self.bucket_region)
-        )
+        # Cached resource sharing the tuned client config (wide connection
+        # pool, adaptive retries, TCP keepalive) with the rest of the
+        # pipeline's pooled transfers.
+        self.s3 = AWSConnection().get_resource("s3", region_name=self.bucket_region)
         self.bucket = self.s3.Bucket(self.bucket_name)
         self.client = AWSConnection().get_client("s3")
 
@@ -44,14 +53,23 @@ class S3IOUtil:
                     )
 
             if content is not None:
-                # Upload content directly
-                self.client.put_object(
-                    Bucket=self.bucket_name, Key=file_path, Body=content
+                # Upload content directly; upload_fileobj switches to
+                # concurrent multipart parts past the transfer threshold
+                # instead of one monolithic PUT.
+                if isinstance(content, str):
+                    content = content.encode("utf-8")
+                self.client.upload_fileobj(
+                    BytesIO(content),
+                    self.bucket_name,
+                    file_path,
+                    Config=_TRANSFER_CONFIG,
                 )
                 logger.info(f"Content uploaded successfully to {file_path}")
             elif file_path is not None:
-                # Upload file from disk
-                self.bucket.upload_file(file_path, object_name)
+                # Upload file from disk; like the content path above, large
+                # files go up as concurrent multipart parts (with per-part
+                # retry) instead of one monolithic PUT.
+                self.bucket.upload_file(file_path, object_name, Config=_TRANSFER_CONFIG)
                 logger.info(f"File {file_path} uploaded successfully.")
             else:
                 raise ValueError("Either file_path or content must be provided.")
@@ -94,19 +112,43 @@ class S3IOUtil:
             logger.error(f"Failed to download file: {e}")
             return None
 
-    def list_files(self, prefix=""):
-        """List all files in the S3 bucket."""
+    def list_files(self, prefix="", suffix=None):
+        """List all files in the S3 bucket, optionally filtered by key suffix."""
         try:
             files = []
             for obj in self.bucket.objects.filter(Prefix=prefix):
-                if not obj.key.endswith("/"):
-                    files.append(obj.key)
+                if obj.key.endswith("/"):
+                    continue
+                if suffix is not None and not obj.key.endswith(suffix):
+                    continue
+                files.append(obj.key)
             logger.info(f"Number of Files in bucket: {len(files)}")
             return files
         except ClientError as e:
             logger.info(f"Failed to list files: {e}")
             return []
 
+    def iter_files(self, prefix="", suffix=None):
+        """Yield object keys under a prefix lazily, page by page.
+
+        Unlike list_files, consumers can start working after the first
+        ListObjectsV2 page (~1000 keys) instead of waiting for the full
+        enumeration of a large prefix. An optional key suffix filter is
+        applied inside the pagination loop.
+        """
+        try:
+            paginator = self.client.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    if key.endswith("/"):
+                        continue
+                    if suffix is not None and not key.endswith(suffix):
+                        continue
+                    yield key
+        except ClientError as e:
+            logger.info(f"Failed to list files: {e}")
+
     def delete_file(self, object_name):
         """Delete a file from the S3 bucket."""
         try:
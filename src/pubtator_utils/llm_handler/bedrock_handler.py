@@ -35,6 +35,30 @@ class BedrockHandler:
         )
         return llm
 
+    @staticmethod
+    def build_cached_prompt_messages(static_prefix: str, dynamic_text: str):
+        """Build a message list that marks the static prompt prefix for
+        provider-side prompt caching.
+
+        Anthropic models on Bedrock skip prefill for content blocks tagged
+        with a cache_control checkpoint, so the shared persona/instructions/
+        guidelines prefix is only processed once per cache window instead of
+        once per article.
+        """
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": static_prefix,
+                        "cache_control": {"type": "ephemeral"},
+                    },
+                    {"type": "text", "text": dynamic_text},
+                ],
+            }
+        ]
+
     def get_embed_llm(self):
         # Get the bedrock client
         embeddings_llm = BedrockEmbeddings(
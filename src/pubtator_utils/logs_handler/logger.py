@@ -7,12 +7,23 @@ class SingletonLogger:
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
             cls._instance = super().__new__(cls, *args, **kwargs)
-            cls._instance.logger = logging.getLogger(__name__)
+            # Configure the root logger exactly once; later instantiations
+            # reuse the already-configured instance without re-running
+            # basicConfig.
             logging.basicConfig(
                 level=logging.INFO,
                 format="%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
             )
+            cls._instance.logger = logging.getLogger(__name__)
         return cls._instance
 
-    def get_logger(self):
+    def get_logger(self, name: str = None):
+        """Return a logger, optionally scoped to the caller's module.
+
+        Pass __name__ to get a standard per-module stdlib logger; with no
+        argument the shared default logger is returned for backwards
+        compatibility.
+        """
+        if name:
+            return logging.getLogger(name)
         return self.logger
@@ -19,10 +19,13 @@ def load_transformer_from_s3_path(
     os.makedirs(local_dir, exist_ok=True)
 
     try:
-        response = s3.list_objects_v2(Bucket=s3_bucket, Prefix=s3_model_path)
-
-        if "Contents" in response:
-            for obj in response["Contents"]:
+        # A single list_objects_v2 call caps out at 1000 keys and silently
+        # truncates larger prefixes; the paginator streams every page.
+        paginator = s3.get_paginator("list_objects_v2")
+        found_objects = False
+        for page in paginator.paginate(Bucket=s3_bucket, Prefix=s3_model_path):
+            for obj in page.get("Contents", []):
+                found_objects = True
                 s3_key = obj["Key"]
                 local_path = os.path.join(
                     local_dir, os.path.relpath(s3_key, s3_model_path)
@@ -30,6 +33,7 @@ def load_transformer_from_s3_path(
                 os.makedirs(os.path.dirname(local_path), exist_ok=True)
                 s3.download_file(s3_bucket, s3_key, local_path)
 
+        if found_objects:
             if model_class and tokenizer_class:
                 model = model_class.from_pretrained(local_dir)
                 tokenizer = tokenizer_class.from_pretrained(local_dir)